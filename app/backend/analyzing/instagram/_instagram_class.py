@@ -1,18 +1,17 @@
 # -*- coding: utf-8 -*-
 """The module with the Instagram analyzing class."""
 
-from app.backend.analyzing.substring_match.find_similarity_ratio import find_similarity_ratio
+from app.backend.analyzing.substring_match.find_similarity_ratio import (
+    DESCRIPTION_SIMILARITY_THRESHOLD,
+    find_similarity_ratios,
+)
 
 
 class InstagramAnalyze:
     """The class to analyze scraped Instagram profiles by their nickname and biography."""
     def __init__(self, scraping_response, user_input):
         self.user_info_as_dicts = scraping_response["instagram"]
-        self.required_instagram_nickname = user_input["instagram_nickname"]
-        self.required_full_name = " ".join([
-            user_input["first_name"],
-            user_input["last_name"]
-        ])
+        self.user_input = user_input
         self.required_description = user_input.get("additional_text")
         self.user_info_after_name_filter = []
         self.user_info_after_desc_filter = []
@@ -25,19 +24,37 @@ class InstagramAnalyze:
     def __instagram_filter_by_nick_or_name(self):
         """Filter scraped Instagram profiles by their nickname."""
         for user_info in self.user_info_as_dicts:
-            received_instagram_nickname = user_info["username"]
-            received_full_name = user_info["full_name"]
-            if self.required_instagram_nickname == received_instagram_nickname \
-                    or not self.required_instagram_nickname \
-                    and self.required_full_name == received_full_name:
+            if self.instagram_nick_or_name_matches(user_info, self.user_input):
                 self.user_info_after_name_filter.append(user_info)
 
+    @staticmethod
+    def instagram_nick_or_name_matches(user_info: dict, user_input: dict) -> bool:
+        """
+        Check a profile against the nickname filter: the nickname (if user input has \
+        a nickname), otherwise the full name. Profiles failing it are dropped by the analysis \
+        whatever their biography is, so it can run on search results before users' info \
+        is scraped.
+
+        Args:
+            `user_info`: the profile (only ``username`` and ``full_name`` are needed).\n
+            `user_input`: user input represented as a dict.
+        Returns:
+            `bool`: True if the profile passes the filter.
+        """
+        required_instagram_nickname = user_input["instagram_nickname"]
+        required_full_name = " ".join([user_input["first_name"], user_input["last_name"]])
+        received_instagram_nickname = user_info["username"]
+        received_full_name = user_info["full_name"]
+        return required_instagram_nickname == received_instagram_nickname \
+            or not required_instagram_nickname \
+            and required_full_name == received_full_name
+
     def __instagram_filter_by_biography(self):
         """Filter Instagram subjects after the nickname filter by their biography."""
-        for user_info in self.user_info_after_name_filter:
-            received_description = user_info["biography"]
-            similarity = find_similarity_ratio(
-                self.required_description, received_description
-            )
-            if similarity >= 0.6:
-                self.user_info_after_desc_filter.append(user_info)
+        biographies = [user_info["biography"] for user_info in self.user_info_after_name_filter]
+        similarities = find_similarity_ratios(self.required_description, biographies)
+        self.user_info_after_desc_filter.extend(
+            user_info
+            for user_info, similarity in zip(self.user_info_after_name_filter, similarities)
+            if similarity >= DESCRIPTION_SIMILARITY_THRESHOLD
+        )
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""The module computing fingerprints of strings by winnowing with NumPy array operations."""
+
+import string
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+# Characters removed from strings before fingerprinting
+_SANITIZING_TABLE = str.maketrans("", "", string.punctuation + "\n\r ")
+_HASH_DTYPES = {8: np.uint8, 16: np.uint16, 32: np.uint32, 64: np.uint64}
+# Arithmetic on uint64 arrays wraps around modulo 2 ** 64
+_WORD_MODULO = 2 ** 64
+
+
+class TextFingerprint(NamedTuple):
+    """
+    The fingerprint of a string: its distinct selected hashes (sorted) \
+    and the number of hashes selected by winnowing (with repeated ones).
+    """
+    hashes: np.ndarray
+    size: int
+
+
+class Winnowing:
+    """
+    The class to fingerprint strings with rolling hashes of k-grams and winnowing \
+    by Stanford (http://theory.stanford.edu/~aiken/publications/papers/sigmod03.pdf).
+
+    It gives the same fingerprints as the ``fingerprint`` library with \
+    ``modulo=2 ** hash_bits`` (the rolling hash of the library included), \
+    but computes hashes and window minima with vectorized NumPy operations.
+    """
+    def __init__(self, kgram_len: int = 4, window_len: int = 3, base: int = 101,
+                 hash_bits: int = 8):
+        if hash_bits not in _HASH_DTYPES:
+            raise ValueError(f"hash_bits must be one of {sorted(_HASH_DTYPES)}")
+        if base % 2 == 0:
+            raise ValueError("base must be odd")
+        self.kgram_len = kgram_len
+        self.window_len = window_len
+        self.base = base
+        self.hash_bits = hash_bits
+        self.__hash_dtype = _HASH_DTYPES[hash_bits]
+        self.__kgram_weights = np.array(
+            [pow(base, kgram_len - 1 - i, _WORD_MODULO) for i in range(kgram_len)],
+            dtype=np.uint64,
+        )
+        self.__base_to_kgram_len = np.uint64(pow(base, kgram_len, _WORD_MODULO))
+        # Odd numbers modulo 2 ** 64 have orders dividing 2 ** 62, so the inverse is
+        # base ** (2 ** 62 - 1) (pow with a negative exponent needs Python 3.8)
+        self.__inverse_base = pow(base, 2 ** 62 - 1, _WORD_MODULO)
+        self.__base_powers = self.__inverse_base_powers = np.ones(0, dtype=np.uint64)
+
+    def fingerprint(self, text: str) -> Optional[TextFingerprint]:
+        """
+        Fingerprint the string without punctuation, spaces and line breaks.
+
+        Args:
+            `text`: the string to fingerprint.
+        Returns:
+            `TextFingerprint`: the fingerprint of the string \
+            or None if the sanitized string is too short to have a window of k-grams.
+        """
+        codes = _encode(text.translate(_SANITIZING_TABLE))
+        if len(codes) < self.kgram_len + self.window_len - 1:
+            return None
+        hashes = self.__hash_kgrams(codes)
+        selected_hashes = hashes[self.__select_positions(hashes)]
+        return TextFingerprint(np.unique(selected_hashes), len(selected_hashes))
+
+    def __hash_kgrams(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Compute the rolling hashes of all k-grams at once.
+
+        The rolling hash is ``h[j] = (h[j - 1] - c[j - 1] * B ** k + c[j + k - 1]) * B``, \
+        so ``h[j] = B ** j * (h[0] + sum(B ** (1 - t) * d[t] for t in 1..j))`` \
+        with ``d[t] = c[t + k - 1] - c[t - 1] * B ** k``; it is computed modulo ``2 ** 64`` \
+        (where the base is invertible) and reduced to the hash width.
+
+        Args:
+            `codes`: the code points of the sanitized string.
+        Returns:
+            `np.ndarray`: the hashes of k-grams.
+        """
+        kgram_count = len(codes) - self.kgram_len + 1
+        if len(self.__base_powers) < kgram_count:
+            self.__grow_power_tables(kgram_count)
+        first_hash = np.dot(codes[:self.kgram_len], self.__kgram_weights)
+        deltas = codes[self.kgram_len:] - codes[:kgram_count - 1] * self.__base_to_kgram_len
+        # B ** (1 - t) * d[t] for t in 1..j, the first term is h[0]
+        scaled_terms = np.empty(kgram_count, dtype=np.uint64)
+        scaled_terms[0] = first_hash
+        np.multiply(deltas, self.__inverse_base_powers[:kgram_count - 1], out=scaled_terms[1:])
+        hashes = self.__base_powers[:kgram_count] * np.cumsum(scaled_terms, dtype=np.uint64)
+        return hashes.astype(self.__hash_dtype)
+
+    def __grow_power_tables(self, length: int):
+        """
+        Grow the tables of powers of the base and of its inverse (modulo ``2 ** 64``) \
+        to at least the length (the tables are shared by all strings).
+
+        Args:
+            `length`: the number of powers needed.
+        """
+        length = max(length, 2 * len(self.__base_powers), 256)
+        powers = np.empty(length, dtype=np.uint64)
+        powers[0] = 1
+        powers[1:] = self.base
+        base_powers = np.cumprod(powers, dtype=np.uint64)
+        powers[1:] = self.__inverse_base
+        self.__inverse_base_powers = np.cumprod(powers, dtype=np.uint64)
+        self.__base_powers = base_powers
+
+    def __select_positions(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Select positions of the rightmost minimal hashes of all windows, each once.
+
+        Args:
+            `hashes`: the hashes of k-grams.
+        Returns:
+            `np.ndarray`: the selected positions in order.
+        """
+        window_count = len(hashes) - self.window_len + 1
+        minimums = hashes[:window_count].copy()
+        window_starts = np.arange(window_count)
+        positions = window_starts.copy()
+        for offset in range(1, self.window_len):
+            shifted_hashes = hashes[offset:offset + window_count]
+            # Later hashes equal to the minimum win, the minimum is the rightmost one
+            is_new_minimum = shifted_hashes <= minimums
+            np.copyto(minimums, shifted_hashes, where=is_new_minimum)
+            np.copyto(positions, window_starts + offset, where=is_new_minimum)
+        # Positions of consecutive windows do not decrease, a changed one is a new selection
+        is_new_position = np.empty(len(positions), dtype=bool)
+        is_new_position[0] = True
+        np.not_equal(positions[1:], positions[:-1], out=is_new_position[1:])
+        return positions[is_new_position]
+
+
+def similarity_of_fingerprints(f_fingerprint: TextFingerprint,
+                               s_fingerprint: TextFingerprint) -> float:
+    """
+    Find the share of common distinct hashes in the smaller fingerprint.
+
+    Args:
+        `f_fingerprint`: the fingerprint of the first string.\n
+        `s_fingerprint`: the fingerprint of the second string.
+    Returns:
+        `float`: the similarity ratio between two strings.
+    """
+    common_hashes = np.intersect1d(
+        f_fingerprint.hashes, s_fingerprint.hashes, assume_unique=True
+    )
+    return len(common_hashes) / min(f_fingerprint.size, s_fingerprint.size)
+
+
+def similarities_to_fingerprints(query_fingerprint: TextFingerprint,
+                                 candidate_fingerprints: List[Optional[TextFingerprint]]
+                                 ) -> np.ndarray:
+    """
+    Find the similarity of the query with all candidates together: distinct hashes \
+    of candidates are packed into one array and looked up in the query hashes at once.
+
+    Args:
+        `query_fingerprint`: the fingerprint of the query.\n
+        `candidate_fingerprints`: the fingerprints of candidates (None for too short ones).
+    Returns:
+        `np.ndarray`: the similarity ratios in the order of candidates \
+        (0 for candidates without a fingerprint).
+    """
+    has_fingerprint = np.array(
+        [fingerprint is not None for fingerprint in candidate_fingerprints], dtype=bool
+    )
+    fingerprints = [
+        fingerprint for fingerprint in candidate_fingerprints if fingerprint is not None
+    ]
+    similarities = np.zeros(len(candidate_fingerprints))
+    if not fingerprints:
+        return similarities
+    packed_hashes = np.concatenate([fingerprint.hashes for fingerprint in fingerprints])
+    owners = np.repeat(
+        np.arange(len(fingerprints)),
+        [len(fingerprint.hashes) for fingerprint in fingerprints],
+    )
+    is_common = np.isin(packed_hashes, query_fingerprint.hashes)
+    common_counts = np.bincount(owners[is_common], minlength=len(fingerprints))
+    sizes = np.array([fingerprint.size for fingerprint in fingerprints])
+    similarities[has_fingerprint] = common_counts / np.minimum(sizes, query_fingerprint.size)
+    return similarities
+
+
+def _encode(text: str) -> np.ndarray:
+    """
+    Get the code points of the string.
+
+    Args:
+        `text`: the string.
+    Returns:
+        `np.ndarray`: the code points as ``uint64``.
+    """
+    if text.isascii():
+        code_points = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    else:
+        code_points = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    return code_points.astype(np.uint64)
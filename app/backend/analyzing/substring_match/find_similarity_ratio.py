@@ -1,38 +1,123 @@
 # -*- coding: utf-8 -*-
 """The main module finding similarity ratio between two strings."""
 
-from fingerprint import Fingerprint
-from fingerprint.fingerprint import FingerprintException
+from functools import lru_cache
 
-FINGERPRINT = Fingerprint(kgram_len=4, window_len=3, base=101, modulo=256)
+import numpy as np
 
+from app.backend.analyzing.substring_match._winnowing import (
+    Winnowing,
+    similarities_to_fingerprints,
+    similarity_of_fingerprints,
+)
 
-def find_similarity_ratio(f_string: str, s_string: str) -> float:
+WINNOWING = Winnowing(kgram_len=4, window_len=3, base=101, hash_bits=8)
+CANDIDATE_FINGERPRINTS_CACHE_SIZE = 1024
+# The least similarity ratio of descriptions of the same person
+DESCRIPTION_SIMILARITY_THRESHOLD = 0.6
+
+
+def find_similarity_ratio(f_string: str, s_string: str,
+                          winnowing: Winnowing = WINNOWING) -> float:
     """
     Take two strings and find similarity between them using \
     Rabin fingerprint and winnowing by Stanford.
 
     Args:
          `f_string`: first string.\n
-         `s_string`: second string.
+         `s_string`: second string.\n
+         `winnowing`: the fingerprinting parameters (k-grams of 4, windows of 3, \
+         base 101 and 8-bit hashes by default; wider hashes give fewer false matches).
     Returns:
-        `float`: the similarity ratio between two strings.
+        `float`: the similarity ratio between two strings \
+        (0 if any of them is too short to be fingerprinted).
     """
-    try:
-        f_string_fingerprint = FINGERPRINT.generate(str=f_string)
-        s_string_fingerprint = FINGERPRINT.generate(str=s_string)
-    except (FingerprintException, IndexError):
+    f_string_fingerprint = winnowing.fingerprint(f_string)
+    if f_string_fingerprint is None:
         return 0
-    f_string_only_hashes = [
-        element[0]
-        for element in f_string_fingerprint
-    ]
-    s_string_only_hashes = [
-        element[0]
-        for element in s_string_fingerprint
-    ]
-    common_hashes = set(f_string_only_hashes).intersection(set(s_string_only_hashes))
-    minimal_length_of_string_hashes = len(
-        min(f_string_only_hashes, s_string_only_hashes, key=len)
-    )
-    return len(common_hashes) / minimal_length_of_string_hashes
+    s_string_fingerprint = winnowing.fingerprint(s_string)
+    if s_string_fingerprint is None:
+        return 0
+    return similarity_of_fingerprints(f_string_fingerprint, s_string_fingerprint)
+
+
+def find_similarity_ratios(query: str, candidates: list,
+                           winnowing: Winnowing = WINNOWING) -> np.ndarray:
+    """
+    Take a query string and many candidates and find similarity between the query \
+    and every candidate together.
+
+    Args:
+        `query`: the string to compare with candidates.\n
+        `candidates`: the strings to compare with the query.\n
+        `winnowing`: the fingerprinting parameters.
+    Returns:
+        `np.ndarray`: the same similarity ratios as ``find_similarity_ratio`` \
+        in the order of candidates.
+    """
+    return SimilarityIndex(query, winnowing).scores(candidates)
+
+
+def most_similar(similarities: np.ndarray, k: int,
+                 threshold: float = DESCRIPTION_SIMILARITY_THRESHOLD) -> np.ndarray:
+    """
+    Find the candidates most similar to the query.
+
+    Args:
+        `similarities`: the similarity ratios of candidates.\n
+        `k`: the greatest number of candidates to find.\n
+        `threshold`: the least similarity ratio of the found candidates.
+    Returns:
+        `np.ndarray`: positions of at most k candidates with ratios not less than \
+        the threshold, from the most similar (earlier candidates first among equal ones).
+    """
+    positions = np.flatnonzero(similarities >= threshold)
+    order = np.argsort(-similarities[positions], kind="stable")
+    return positions[order[:k]]
+
+
+class SimilarityIndex:
+    """
+    The class to find similarity ratios between one query string and many candidates: \
+    the query is fingerprinted once, and fingerprints of candidates are kept \
+    in a bounded LRU cache (by the candidate string), so comparing the query \
+    with N candidates fingerprints at most N strings.
+    """
+    def __init__(self, query: str, winnowing: Winnowing = WINNOWING,
+                 max_candidates: int = CANDIDATE_FINGERPRINTS_CACHE_SIZE):
+        self.query = query
+        self.__query_fingerprint = winnowing.fingerprint(query)
+        self.__candidate_fingerprint = lru_cache(maxsize=max_candidates)(winnowing.fingerprint)
+
+    def score(self, candidate: str) -> float:
+        """
+        Find the similarity ratio between the query and the candidate.
+
+        Args:
+            `candidate`: the string to compare with the query.
+        Returns:
+            `float`: the same similarity ratio as ``find_similarity_ratio`` \
+            of the query and the candidate.
+        """
+        if self.__query_fingerprint is None:
+            return 0
+        candidate_fingerprint = self.__candidate_fingerprint(candidate)
+        if candidate_fingerprint is None:
+            return 0
+        return similarity_of_fingerprints(self.__query_fingerprint, candidate_fingerprint)
+
+    def scores(self, candidates: list) -> np.ndarray:
+        """
+        Find the similarity ratios between the query and all candidates together.
+
+        Args:
+            `candidates`: the strings to compare with the query.
+        Returns:
+            `np.ndarray`: the similarity ratios in the order of candidates.
+        """
+        if self.__query_fingerprint is None:
+            return np.zeros(len(candidates))
+        candidate_fingerprints = [
+            self.__candidate_fingerprint(candidate) for candidate in candidates
+        ]
+        return similarities_to_fingerprints(self.__query_fingerprint, candidate_fingerprints)
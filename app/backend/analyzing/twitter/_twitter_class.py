@@ -2,7 +2,10 @@
 """The Twitter analyzing module with the necessary class."""
 
 import string
-from app.backend.analyzing.substring_match.find_similarity_ratio import find_similarity_ratio
+from app.backend.analyzing.substring_match.find_similarity_ratio import (
+    DESCRIPTION_SIMILARITY_THRESHOLD,
+    find_similarity_ratios,
+)
 
 
 class TwitterAnalyze:
@@ -33,11 +36,9 @@ class TwitterAnalyze:
         """
         Run filtering against screen names (if user input has a screen name).
         """
-        required_screen_name = self.user_input["twitter_profile"]
         for info_and_posts in self.tuples_of_info_and_posts:
             only_user_info = info_and_posts[0]
-            twitter_screen_name = only_user_info["screen_name"]
-            if required_screen_name == twitter_screen_name:
+            if self.twitter_name_matches(only_user_info, self.user_input):
                 self.tuples_after_all_filters.append(info_and_posts)
                 break
 
@@ -45,29 +46,42 @@ class TwitterAnalyze:
         """
         Run filtering against first and last names (if no screen name was required).
         """
-        required_first_name = self.user_input["first_name"]
-        required_last_name = self.user_input["last_name"]
-        required_full_name = " ".join([required_first_name, required_last_name])
         for info_and_posts in self.tuples_of_info_and_posts:
             only_user_info = info_and_posts[0]
-            twitter_full_name = only_user_info["name"]
-            try:
-                twitter_full_name.encode("ascii")
-            except UnicodeEncodeError:
-                required_full_name_in_set = set(required_full_name)
-                received_full_name_in_set = set(twitter_full_name)
-                set_intersection_len = len(
-                    required_full_name_in_set.intersection(received_full_name_in_set)
-                )
-                minimal_length_of_sets = len(
-                    min(required_full_name_in_set, received_full_name_in_set, key=len)
-                )
-                similarity = set_intersection_len / minimal_length_of_sets
-                if similarity >= 0.7:
-                    self._tuples_after_name_filter.append(info_and_posts)
-            else:
-                if required_full_name == twitter_full_name:
-                    self._tuples_after_name_filter.append(info_and_posts)
+            if self.twitter_name_matches(only_user_info, self.user_input):
+                self._tuples_after_name_filter.append(info_and_posts)
+
+    @staticmethod
+    def twitter_name_matches(user_info: dict, user_input: dict) -> bool:
+        """
+        Check a subject against the first filter: the screen name (if user input has \
+        a screen name), otherwise first and last names. Subjects failing it are dropped \
+        by the analysis whatever their posts are, so it can run before posts are scraped.
+
+        Args:
+            `user_info`: the subject's info (without posts).\n
+            `user_input`: user input represented as a dict.
+        Returns:
+            `bool`: True if the subject passes the filter.
+        """
+        if user_input["twitter_profile"]:
+            return user_input["twitter_profile"] == user_info["screen_name"]
+        required_full_name = " ".join([user_input["first_name"], user_input["last_name"]])
+        twitter_full_name = user_info["name"]
+        try:
+            twitter_full_name.encode("ascii")
+        except UnicodeEncodeError:
+            required_full_name_in_set = set(required_full_name)
+            received_full_name_in_set = set(twitter_full_name)
+            set_intersection_len = len(
+                required_full_name_in_set.intersection(received_full_name_in_set)
+            )
+            minimal_length_of_sets = len(
+                min(required_full_name_in_set, received_full_name_in_set, key=len)
+            )
+            similarity = set_intersection_len / minimal_length_of_sets
+            return similarity >= 0.7
+        return required_full_name == twitter_full_name
 
     def __twitter_analyze_location(self):
         """
@@ -91,15 +105,18 @@ class TwitterAnalyze:
         Run filtering against description (if no screen name was required \
         and location filter succeeded).
         """
-        required_additional_text = self.user_input["additional_text"]
-        for info_and_posts in self.tuples_after_location_filter:
-            only_user_info = info_and_posts[0]
-            twitter_description = only_user_info["description"]
-            similarity = find_similarity_ratio(
-                required_additional_text, twitter_description
-            )
-            if similarity >= 0.6:
-                self.tuples_after_all_filters.append(info_and_posts)
+        twitter_descriptions = [
+            info_and_posts[0]["description"]
+            for info_and_posts in self.tuples_after_location_filter
+        ]
+        similarities = find_similarity_ratios(
+            self.user_input["additional_text"], twitter_descriptions
+        )
+        self.tuples_after_all_filters.extend(
+            info_and_posts
+            for info_and_posts, similarity in zip(self.tuples_after_location_filter, similarities)
+            if similarity >= DESCRIPTION_SIMILARITY_THRESHOLD
+        )
 
     @staticmethod
     def _twitter_sanitize_and_convert_to_set(input_str: str) -> set:
@@ -6,18 +6,24 @@ from app.backend.analyzing.analyzing import main_analyzing
 from app.backend.visualization.visualization import main_visualization
 
 
-def main_backend(user_input: dict, pdf_output_location: str, progress_bar):
+def main_backend(user_input: dict, pdf_output_location: str, progress_bar,
+                 bypass_cache: bool = False, pushdown_filters: bool = False):
     """
     Commit scraping, analysis and visualization.
 
     Args:
          `user_input`: the app's user input represented as a dict.\n
          `pdf_output_location`: the location on the PC where to output the PDF file.\n
-         `progress_bar`: the PyQt5 QProgressBar to control the flow of the app.
+         `progress_bar`: the PyQt5 QProgressBar to control the flow of the app.\n
+         `bypass_cache`: scrape all profiles from APIs instead of the profile caches.\n
+         `pushdown_filters`: drop subjects failing the first filters of the analysis \
+         before their details are scraped.
     Returns:
         `None`: visualized PDF file.
     """
-    scraping_results = main_scraping(user_input)
+    scraping_results = main_scraping(
+        user_input, bypass_cache=bypass_cache, pushdown_filters=pushdown_filters
+    )
     progress_bar.setValue(progress_bar.value() + 58)
     analysis_results = main_analyzing(
         scraping_response=scraping_results, user_input=user_input
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""The Google Search module to get the country code of the user of the app."""
+
+import json
+import os
+import tempfile
+import threading
+import time
+
+import requests
+
+COUNTRY_CODE_ENV = "GOOGLE_SEARCH_COUNTRY_CODE"
+CACHE_FILE_ENV = "GOOGLE_SEARCH_COUNTRY_CODE_CACHE_FILE"
+CACHE_TTL = 24 * 60 * 60
+
+
+def fetch_country_code_from_ipstack() -> str:
+    """
+    Get the country of the user of the app from ipstack.
+
+    Returns:
+        `str`: the country code of the user.
+    """
+    api = os.getenv("IPSTACK_API_KEY")
+    url = f"https://api.ipstack.com/check?access_key={api}"
+    json_response = requests.get(url).json()
+    return json_response["country_code"]
+
+
+class CountryCodeProvider:
+    """
+    The class to get the country code of the user once per process: \
+    from the override (argument or the ``GOOGLE_SEARCH_COUNTRY_CODE`` variable), \
+    from the on-disk cache while it is fresh, or from the geolocation service.
+
+    The on-disk cache is used only if its file is given as an argument \
+    or with the ``GOOGLE_SEARCH_COUNTRY_CODE_CACHE_FILE`` variable.
+    """
+    def __init__(self, fetch_country_code=fetch_country_code_from_ipstack,
+                 cache_file: str = None, cache_ttl: float = CACHE_TTL, override: str = None):
+        self.fetch_country_code = fetch_country_code
+        self.cache_file = cache_file
+        self.cache_ttl = cache_ttl
+        self.override = override
+        self.__country_code = None
+        self.__lock = threading.Lock()
+
+    def get_country_code(self) -> str:
+        """
+        Get the country code of the user, looking it up only on the first call.
+
+        Returns:
+            `str`: the lowercase country code of the user.
+        """
+        with self.__lock:
+            if self.__country_code is None:
+                self.__country_code = self.__resolve_country_code().lower()
+            return self.__country_code
+
+    def __resolve_country_code(self) -> str:
+        """
+        Get the country code from the override, the on-disk cache or the geolocation service.
+
+        Returns:
+            `str`: the country code of the user.
+        """
+        override = self.override or os.getenv(COUNTRY_CODE_ENV)
+        if override:
+            return override
+        cache_file = self.cache_file or os.getenv(CACHE_FILE_ENV)
+        if cache_file:
+            cached_country_code = self.__read_cache_file(cache_file)
+            if cached_country_code:
+                return cached_country_code
+        country_code = self.fetch_country_code()
+        if cache_file:
+            self.__write_cache_file(cache_file, country_code)
+        return country_code
+
+    def __read_cache_file(self, cache_file: str):
+        """
+        Read the country code from the on-disk cache if it is there and fresh.
+
+        Args:
+            `cache_file`: the path of the cache file.
+        Returns:
+            `str`: the cached country code or None.
+        """
+        try:
+            with open(cache_file) as file:
+                cached = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if time.time() - cached.get("fetched_at", 0) > self.cache_ttl:
+            return None
+        return cached.get("country_code")
+
+    @staticmethod
+    def __write_cache_file(cache_file: str, country_code: str):
+        """
+        Write the country code to the on-disk cache atomically.
+
+        Args:
+            `cache_file`: the path of the cache file.\n
+            `country_code`: the country code of the user.
+        """
+        directory = os.path.dirname(os.path.abspath(cache_file))
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=directory, delete=False) as file:
+            json.dump({"country_code": country_code, "fetched_at": time.time()}, file)
+        os.replace(file.name, cache_file)
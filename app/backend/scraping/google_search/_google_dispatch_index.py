@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""The Google link filtering module to find site configs of links by the params file regexes."""
+
+import re
+from typing import Iterator, Optional
+from urllib.parse import urlsplit
+
+# The literal host of a link regex like ``https:\/\/github\.com\/...``
+# (a host with an unescaped dot, which matches any character, is not literal).
+_LITERAL_HOST_REGEX = re.compile(
+    r"\^?https?\??:(?:\\?/){2}((?:[A-Za-z0-9-]|\\\.)+)(?:\\?/|\$?$)"
+)
+# Tokens of a regex: escapes, character classes, group references and single characters
+_REGEX_TOKEN_REGEX = re.compile(r"\\.|\[\^?\]?(?:\\.|[^\]\\])*\]|\(\?P=|\(\?\(|.", re.S)
+_BACKREFERENCE_TOKENS = ("(?P=", "(?(")
+_NUMBERED_BACKREFERENCES = tuple(f"\\{digit}" for digit in range(1, 10))
+# The flags of a regex without inline flags
+_DEFAULT_FLAGS = re.compile("").flags
+
+
+class LinkDispatchIndex:
+    """
+    The class to find site configs of links: link regexes of the params file \
+    are bucketed by their literal host, and each link is tested only against \
+    one combined precompiled regex of its host (and of regexes without a literal host).
+
+    Regexes that cannot be combined or bucketed (with alternation, \
+    backreferences, named groups or global inline flags) are tested one by one.
+    """
+    def __init__(self, configs_by_regex: dict):
+        entries_by_host = {}
+        self.__separate_entries = []
+        for i, (regex, config) in enumerate(configs_by_regex.items()):
+            if _needs_separate_match(regex):
+                self.__separate_entries.append((i, re.compile(regex), config))
+            else:
+                entries_by_host.setdefault(_literal_host(regex), []).append((i, regex, config))
+        self.__patterns_by_host = {
+            host: _CombinedPatterns(entries) for host, entries in entries_by_host.items()
+        }
+        self.__patterns_without_host = self.__patterns_by_host.pop(None, None)
+
+    def match(self, link: str) -> list:
+        """
+        Find the site configs whose regexes fully match the link.
+
+        Args:
+            `link`: the link to classify.
+        Returns:
+            `list`: the matching site configs in the order of the params file.
+        """
+        try:
+            host = urlsplit(link).hostname
+        except ValueError:
+            host = None
+        matches = []
+        for patterns in (self.__patterns_by_host.get(host), self.__patterns_without_host):
+            if patterns is not None:
+                matches.extend(patterns.match(link))
+        matches.extend(
+            (i, config)
+            for i, pattern, config in self.__separate_entries
+            if pattern.fullmatch(link)
+        )
+        matches.sort(key=lambda match: match[0])
+        return [config for _, config in matches]
+
+
+class _CombinedPatterns:
+    """The class to test a link against several regexes with one combined regex."""
+    def __init__(self, entries: list):
+        self.__entries = entries
+        self.__patterns = [re.compile(regex) for _, regex, _ in entries]
+        self.__combined_pattern = re.compile("|".join(
+            f"(?P<_site{k}>{regex})" for k, (_, regex, _) in enumerate(entries)
+        ))
+
+    def match(self, link: str) -> Iterator[tuple]:
+        """
+        Find the regexes that fully match the link.
+
+        Args:
+            `link`: the link to classify.
+        Returns:
+            `iter`: positions in the params file with site configs of the matching regexes.
+        """
+        combined_match = self.__combined_pattern.fullmatch(link)
+        if combined_match is None:
+            return
+        # The combined regex stops at the first matching regex, the rest are checked one by one
+        first = int(combined_match.lastgroup[len("_site"):])
+        for k in range(first, len(self.__entries)):
+            if k == first or self.__patterns[k].fullmatch(link):
+                position, _, config = self.__entries[k]
+                yield position, config
+
+
+def _literal_host(regex: str) -> Optional[str]:
+    """
+    Get the literal host of the link regex.
+
+    Args:
+        `regex`: the link regex from the params file.
+    Returns:
+        `str`: the lowercase host or None if the regex has no literal host.
+    """
+    host_match = _LITERAL_HOST_REGEX.match(regex)
+    if host_match is None:
+        return None
+    return host_match.group(1).replace("\\.", ".").lower()
+
+
+def _needs_separate_match(regex: str) -> bool:
+    """
+    Check whether the link regex has to be tested on its own: its alternation \
+    may make its literal host wrong, and its backreferences, named groups and global inline \
+    flags change their meaning or fail in the combined regex \
+    (any ``|`` outside character classes is taken for alternation).
+
+    Args:
+        `regex`: the link regex from the params file.
+    Returns:
+        `bool`: True if the regex cannot be bucketed by host and combined with others.
+    """
+    pattern = re.compile(regex)
+    if pattern.groupindex or pattern.flags != _DEFAULT_FLAGS:
+        return True
+    return any(
+        token == "|" or token in _BACKREFERENCE_TOKENS or token[:2] in _NUMBERED_BACKREFERENCES
+        for token in _REGEX_TOKEN_REGEX.findall(regex)
+    )
@@ -2,7 +2,10 @@
 """The Google link filtering module."""
 
 import json
-import re
+from functools import lru_cache
+
+from app.backend.scraping.google_search._google_dispatch_index import LinkDispatchIndex
+from app.backend.scraping.scraper._xpath_registry import compile_params
 
 
 def filtering(items: list) -> list:
@@ -15,8 +18,8 @@ def filtering(items: list) -> list:
         `list`: the list of filtered dictionaries of elements according to the params file.
     """
     only_title_link_snippet = _google_filter(items)
-    file_contents = _read_json_file()
-    generator = _regex_matching_items(file_contents, only_title_link_snippet)
+    dispatch_index = _load_dispatch_index()
+    generator = _regex_matching_items(dispatch_index, only_title_link_snippet)
     after_regex_checked_items = list(generator)
     return after_regex_checked_items
 
@@ -58,22 +61,32 @@ def _read_json_file():
     return file_contents
 
 
-def _regex_matching_items(file_contents: dict, items: list) -> iter:
+@lru_cache(maxsize=None)
+def _load_dispatch_index() -> LinkDispatchIndex:
+    """
+    Read the params JSON file, compile its XPATH selectors and link regexes \
+    into the dispatch index once per process.
+
+    Returns:
+        `LinkDispatchIndex`: the index of link regexes with compiled `SiteSelectors`.
+    """
+    return LinkDispatchIndex(compile_params(_read_json_file()))
+
+
+def _regex_matching_items(dispatch_index: LinkDispatchIndex, items: list) -> iter:
     """
-    Take JSON-loaded contents and list of dictionaries of links \
+    Take the dispatch index of link regexes and list of dictionaries of links \
     and filter to those meeting regex requirements.
 
     Args:
-        `file_contents`: JSON-loaded contents represented as a Python dict.\n
+        `dispatch_index`: the index of link regexes with site configs.\n
         `items`: the list of dictionaries of links with \
         only ``title``, ``link``, ``snippet`` keys.
     Returns:
         `iter`: iterable that can be transformed to the list of regex matching links \
         with the XPATH of elements that should be found.
     """
-    keys = file_contents.keys()
     for filtered_dict in items:
         link = filtered_dict["link"]
-        for key in keys:
-            if re.fullmatch(key, link):
-                yield link, file_contents[key]
+        for site_config in dispatch_index.match(link):
+            yield link, site_config
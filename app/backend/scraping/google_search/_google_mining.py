@@ -1,56 +1,111 @@
 # -*- coding: utf-8 -*-
 """The Google link mining module."""
 
+import json
 import os
+import threading
+from functools import lru_cache
+
 from googleapiclient.discovery import build
-import requests
+from googleapiclient.http import build_http
 
+from app.backend.scraping.google_search._google_country_code import CountryCodeProvider
+from app.backend.scraping.helpers.persistent_cache import PersistentCache
 
-def mining(query: str) -> list:
-    """
-    Call other functions to mine information about a particular person.
+COUNTRY_CODE_PROVIDER = CountryCodeProvider()
+RESULTS_PER_PAGE = 10
+# Custom Search API gives at most 100 results to a query
+MAX_PAGES = 10
+SEARCH_RESULT_CACHE = PersistentCache("google_custom_search", ttl=24 * 60 * 60, max_entries=1000)
 
-    Args:
-        `query`: the query to which links will be found.
-    Returns:
-        `list`: the list of dictionaries of found info to the input query.
-    """
-    country = _get_country_code()
-    found_items = _custom_search(query, country)
-    return found_items
+_THREAD_LOCAL = threading.local()
 
 
-def _get_country_code():
+def mining(query: str, country_code_provider: CountryCodeProvider = None,
+           custom_search=None, result_cache: PersistentCache = None, page: int = 1) -> list:
     """
-    Get the country of the user of the app.
+    Call other functions to mine information about a particular person.
 
+    Args:
+        `query`: the query to which links will be found.\n
+        `country_code_provider`: the provider of the user's country code \
+        (the process-wide one by default).\n
+        `custom_search`: the function taking the query, the country code \
+        and the index of the first result and returning found items \
+        (Google Custom Search API by default).\n
+        `result_cache`: the cache of found items by the query, the country code and the page \
+        (the process-wide one by default), the search is skipped while its entry is fresh.\n
+        `page`: the number of the page of results (from 1 to ``MAX_PAGES``).
     Returns:
-        `str`: the country code of the user.
+        `list`: the list of dictionaries of found info to the input query on the page.
     """
-    api = os.getenv("IPSTACK_API_KEY")
-    url = f"https://api.ipstack.com/check?access_key={api}"
-    json = requests.get(url).json()
-    return json["country_code"].lower()
+    if country_code_provider is None:
+        country_code_provider = COUNTRY_CODE_PROVIDER
+    if custom_search is None:
+        custom_search = _custom_search
+    if result_cache is None:
+        result_cache = SEARCH_RESULT_CACHE
+    if not 1 <= page <= MAX_PAGES:
+        raise ValueError(f"the page must be from 1 to {MAX_PAGES}")
+    start = 1 + (page - 1) * RESULTS_PER_PAGE
+    country = country_code_provider.get_country_code()
+    cache_key = json.dumps([query, country, start])
+    found_items = result_cache.get(cache_key)
+    if found_items is None:
+        found_items = custom_search(query, country, start)
+        result_cache.set(cache_key, found_items)
+    return found_items
 
 
-def _custom_search(query: str, country_code: str) -> list:
+def _custom_search(query: str, country_code: str, start: int = 1) -> list:
     """
     Call Google Custom Search API to find info to the input query.
 
     Args:
          `query`: the query to which links will be found.\n
-         `country_code`: the country code of the user.
+         `country_code`: the country code of the user.\n
+         `start`: the index of the first result (1, 11, 21...).
     Returns:
-         `list`: the list of dictionaries of found info to the input query.
+         `list`: the list of dictionaries of found info to the input query \
+         (empty if there are no results from `start`).
     """
-    service = build("customsearch", "v1", developerKey=os.getenv("GOOGLE_DEVELOPER_KEY"))
+    service = _custom_search_service()
     answer = (
         service.cse()
         .list(
             q=query,
             cx=os.getenv("GOOGLE_CSE_ID"),
             gl=country_code,
+            start=start,
         )
-        .execute()
+        .execute(http=_thread_http())
     )
-    return answer["items"]
+    return answer.get("items", [])
+
+
+@lru_cache(maxsize=None)
+def _custom_search_service():
+    """
+    Build the Custom Search service once per process from the discovery document \
+    bundled with the Google API client (without fetching it).
+
+    Returns:
+        `Resource`: the Custom Search service.
+    """
+    return build(
+        "customsearch", "v1", developerKey=os.getenv("GOOGLE_DEVELOPER_KEY"),
+        static_discovery=True, cache_discovery=False,
+    )
+
+
+def _thread_http():
+    """
+    Get the HTTP client of the current thread to execute requests of the shared service \
+    (the HTTP client is not thread-safe, the service is).
+
+    Returns:
+        `httplib2.Http`: the HTTP client of the current thread.
+    """
+    if not hasattr(_THREAD_LOCAL, "http"):
+        _THREAD_LOCAL.http = build_http()
+    return _THREAD_LOCAL.http
@@ -1,18 +1,27 @@
 # -*- coding: utf-8 -*-
 """The main Google Search scraping module."""
 
-from app.backend.scraping.google_search._google_mining import mining
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from app.backend.scraping.google_search._google_mining import MAX_PAGES, mining
 from app.backend.scraping.google_search._google_filter import filtering
-from app.backend.scraping.scraper.scraping import scraping
+from app.backend.scraping.scraper._scraper_engine import get_scraper_engine
+from app.backend.scraping.scraper.scraping import is_error_record, scrape_many
+
+MINING_WORKERS = 4
+PAGES_PER_QUERY = 1
 
 
-def caller_google_search(user_input):
+def caller_google_search(user_input, pages_per_query: int = PAGES_PER_QUERY):
     """
     Call all Google scraping function to get information about a person \
     and scrape it on selectors.
 
     Args:
-        `user_input`: user input represented as a dictionary.
+        `user_input`: user input represented as a dictionary.\n
+        `pages_per_query`: the number of pages of Google Search results to get to each query \
+        (from 1 to ``MAX_PAGES``, 10 results per page).
     Returns:
         `dict`: the dictionary with links and with elements on them with values.
     """
@@ -35,13 +44,116 @@ def caller_google_search(user_input):
         ]
     }
     input_to_scrape["name"] = full_name
-    for selector, query in input_to_scrape.items():
-        if selector == "name":
-            searching_query = query
-        else:
-            searching_query = " ".join([selector, query])
-        elicited_items = mining(searching_query)
-        filtered_items = filtering(elicited_items)
-        scraped_webpages_for_this_selector = scraping(filtered_items)
-        scraped_webpages[selector] = scraped_webpages_for_this_selector
+    queries_by_selector = {
+        selector: query if selector == "name" else " ".join([selector, query])
+        for selector, query in input_to_scrape.items()
+    }
+    filtered_items_by_selector, scraped_webpages_by_link = get_scraper_engine().run(
+        _search_and_scrape_concurrently(queries_by_selector, pages_per_query)
+    )
+    for selector, filtered_items in filtered_items_by_selector.items():
+        scraped_webpages[selector] = _fan_out_scraped_webpages(
+            filtered_items, scraped_webpages_by_link
+        )
     return results_to_filter
+
+
+async def _search_and_scrape_concurrently(queries_by_selector: dict,
+                                          pages_per_query: int = 1) -> tuple:
+    """
+    Mine and filter links of all pages for all selectors concurrently \
+    (in a bounded pool of threads, as mining is blocking) and start scraping the links \
+    of each page as soon as they are found, scraping every unique link with its config \
+    exactly once.
+
+    Args:
+        `queries_by_selector`: selectors mapped to their searching queries.\n
+        `pages_per_query`: the number of pages of results to get to each query.
+    Returns:
+        `tuple`: selectors mapped to their filtered links with configs, \
+        and unique links with configs mapped to their scraped webpages.
+    Raises:
+        ``ValueError``: if the number of pages is not from 1 to ``MAX_PAGES``.
+    """
+    if not 1 <= pages_per_query <= MAX_PAGES:
+        raise ValueError(f"the number of pages must be from 1 to {MAX_PAGES}")
+    loop = asyncio.get_running_loop()
+    scraping_batches = {}
+
+    async def search_and_start_scraping(pool, query, page):
+        filtered_items = await loop.run_in_executor(pool, _mine_and_filter, query, page)
+        new_links_and_configs = list(dict.fromkeys(
+            link_and_config
+            for link_and_config in filtered_items
+            if link_and_config not in scraping_batches
+        ))
+        batch = asyncio.ensure_future(scrape_many(new_links_and_configs))
+        for i, link_and_config in enumerate(new_links_and_configs):
+            scraping_batches[link_and_config] = (batch, i)
+        return filtered_items
+
+    with ThreadPoolExecutor(max_workers=MINING_WORKERS) as pool:
+        filtered_items_of_pages = await asyncio.gather(*(
+            search_and_start_scraping(pool, query, page)
+            for query in queries_by_selector.values()
+            for page in range(1, pages_per_query + 1)
+        ))
+    filtered_items_of_selectors = [
+        _merge_pages(filtered_items_of_pages[i:i + pages_per_query])
+        for i in range(0, len(filtered_items_of_pages), pages_per_query)
+    ]
+    scraped_webpages_by_link = {}
+    for link_and_config, (batch, i) in scraping_batches.items():
+        scraped_webpages_by_link[link_and_config] = (await batch)[i]
+    filtered_items_by_selector = dict(zip(queries_by_selector, filtered_items_of_selectors))
+    return filtered_items_by_selector, scraped_webpages_by_link
+
+
+def _mine_and_filter(query: str, page: int = 1) -> list:
+    """
+    Mine a page of Google Search results to the query and filter them to links with configs.
+
+    Args:
+        `query`: the query to which links will be found.\n
+        `page`: the number of the page of results.
+    Returns:
+        `list`: the list of links with configs according to the params file.
+    """
+    elicited_items = mining(query, page=page)
+    return filtering(elicited_items)
+
+
+def _merge_pages(filtered_items_of_pages: list) -> list:
+    """
+    Merge the filtered links of pages of one query in the order of pages \
+    (results of later pages repeating earlier ones are dropped).
+
+    Args:
+        `filtered_items_of_pages`: the lists of filtered links with configs of each page.
+    Returns:
+        `list`: the filtered links with configs of the query.
+    """
+    merged_items, seen_items = [], set()
+    for filtered_items in filtered_items_of_pages:
+        merged_items.extend(item for item in filtered_items if item not in seen_items)
+        seen_items.update(filtered_items)
+    return merged_items
+
+
+def _fan_out_scraped_webpages(filtered_items: list, scraped_webpages_by_link: dict) -> list:
+    """
+    Take the filtered links of one selector and give back their scraped webpages \
+    (without the failed ones).
+
+    Args:
+        `filtered_items`: the filtered links with configs of the selector.\n
+        `scraped_webpages_by_link`: unique links with configs mapped to their scraped webpages.
+    Returns:
+        `list`: copies of the scraped webpages of the selector \
+        (the report modifies them while writing).
+    """
+    return [
+        dict(scraped_webpages_by_link[link_and_config])
+        for link_and_config in filtered_items
+        if not is_error_record(scraped_webpages_by_link[link_and_config])
+    ]
@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""The helpers for the scraping module."""
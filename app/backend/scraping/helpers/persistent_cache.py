@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""The scraping helper module with the on-disk cache of scraped results."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+CACHE_DIRECTORY_ENV = "SOCIAL_MEDIA_PROFILER_CACHE_DIR"
+DEFAULT_CACHE_DIRECTORY = "app/backend/scraping/.cache"
+
+
+def cache_directory() -> str:
+    """
+    Get the directory of the on-disk caches (``SOCIAL_MEDIA_PROFILER_CACHE_DIR`` if it is set).
+
+    Returns:
+        `str`: the path of the cache directory.
+    """
+    return os.getenv(CACHE_DIRECTORY_ENV) or DEFAULT_CACHE_DIRECTORY
+
+
+class PersistentCache:
+    """
+    The class to cache JSON-serializable values in an SQLite file with a TTL per entry \
+    and the least recently used entries evicted above `max_entries`.
+
+    The file is ``<name>.sqlite3`` in `directory` (by default, `cache_directory()` \
+    at the time of the first access). `hits` and `misses` count lookups in this process.
+    """
+    def __init__(self, name: str, ttl: float, max_entries: int, directory: str = None):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self.__lock = threading.Lock()
+
+    def get(self, key: str):
+        """
+        Get the fresh value of the key and mark it as recently used.
+
+        Args:
+            `key`: the key of the entry.
+        Returns:
+            `object`: the cached value or None if there is no fresh entry.
+        """
+        now = time.time()
+        with self.__lock, closing(self.__connect()) as connection, connection:
+            row = connection.execute(
+                "SELECT value FROM entries WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            connection.execute("UPDATE entries SET last_used = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, value, ttl: float = None):
+        """
+        Put the value of the key into the cache, dropping expired \
+        and least recently used entries above the size bound.
+
+        Args:
+            `key`: the key of the entry.\n
+            `value`: the JSON-serializable value.\n
+            `ttl`: seconds the entry stays fresh (the cache's TTL by default).
+        """
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        with self.__lock, closing(self.__connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), expires_at, now),
+            )
+            connection.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+            connection.execute(
+                "DELETE FROM entries WHERE key IN ("
+                "SELECT key FROM entries ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def stats(self) -> dict:
+        """
+        Get the counters of the cache.
+
+        Returns:
+            `dict`: the numbers of hits and misses in this process and of stored entries.
+        """
+        with self.__lock, closing(self.__connect()) as connection:
+            (entries,) = connection.execute("SELECT COUNT(*) FROM entries").fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+    def __connect(self) -> sqlite3.Connection:
+        """
+        Connect to the cache file, creating it if needed.
+
+        Returns:
+            `sqlite3.Connection`: the connection to the cache file.
+        """
+        directory = self.directory or cache_directory()
+        os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(os.path.join(directory, f"{self.name}.sqlite3"), timeout=10)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value TEXT, expires_at REAL, last_used REAL)"
+        )
+        return connection
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+The helper module to confine scraped profiles to the information the app uses \
+(shared by scraping and analyzing).
+"""
+
+from typing import Iterable, Mapping, NamedTuple
+
+
+class ProfileProjection(NamedTuple):
+    """
+    The compiled projection of profiles: the kept keys of a profile \
+    and the kept keys of items of its nested lists.
+    """
+    keys: frozenset
+    item_keys: Mapping[str, frozenset]
+
+
+def compile_projection(keys: Iterable[str],
+                       item_keys: Mapping[str, Iterable[str]]) -> ProfileProjection:
+    """
+    Compile the projection of profiles.
+
+    Args:
+        `keys`: the kept keys of a profile.\n
+        `item_keys`: the keys of nested lists mapped to the kept keys of their items.
+    Returns:
+        `ProfileProjection`: the compiled projection.
+    """
+    return ProfileProjection(
+        frozenset(keys),
+        {key: frozenset(selectors) for key, selectors in item_keys.items()},
+    )
+
+
+LINKEDIN_PROFILE_PROJECTION = compile_projection(
+    keys=(
+        "industryName",
+        "lastName",
+        "locationName",
+        "student",
+        "geoCountryName",
+        "firstName",
+        "headline",
+        "experience",
+        "skills",
+        "education",
+        "languages",
+        "publications",
+        "certifications",
+        "honors",
+    ),
+    item_keys={
+        "certifications": ("authority", "name", "timePeriod", "url"),
+        "education": ("degreeName", "fieldOfStudy", "schoolName", "timePeriod"),
+        "experience": ("company", "companyName", "locationName", "timePeriod", "title"),
+        "skills": ("name",),
+    },
+)
+
+
+def project_profile(profile: dict,
+                    projection: ProfileProjection = LINKEDIN_PROFILE_PROJECTION) -> dict:
+    """
+    Confine the profile to the kept keys and the items of its nested lists \
+    to their kept keys in one pass (projecting a projected profile gives it back unchanged).
+
+    Args:
+        `profile`: the profile from API.\n
+        `projection`: the compiled projection of profiles.
+    Returns:
+        `dict`: the new projected profile (values which are not projected are shared with \
+        `profile`).
+    """
+    projected_profile = {}
+    for key, value in profile.items():
+        if key not in projection.keys:
+            continue
+        kept_item_keys = projection.item_keys.get(key)
+        if kept_item_keys is not None:
+            value = [
+                {k: v for k, v in item.items() if k in kept_item_keys} for item in value
+            ]
+        projected_profile[key] = value
+    return projected_profile
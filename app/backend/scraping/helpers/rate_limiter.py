@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""The scraping helper module to keep requests to a service within its rate limit."""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    The class to space out the starts of requests made from several threads \
+    so that there are at most `requests_per_second` of them.
+    """
+    def __init__(self, requests_per_second: float):
+        self.interval = 1 / requests_per_second
+        self.__next_start = 0.0
+        self.__lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next request is allowed to start."""
+        with self.__lock:
+            now = time.monotonic()
+            start = max(now, self.__next_start)
+            self.__next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
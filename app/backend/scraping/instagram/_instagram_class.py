@@ -3,6 +3,8 @@
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
 
 from instagram_private_api import (
     Client,
@@ -10,24 +12,56 @@ from instagram_private_api import (
     ClientLoginRequiredError,
 )
 
+from app.backend.scraping.helpers.persistent_cache import PersistentCache
+from app.backend.scraping.helpers.rate_limiter import RateLimiter
 from app.backend.scraping.instagram._instagram_cookies import (
     _load_from_json,
     _on_login_callback,
 )
 
+USER_INFO_KEYS = (
+    "username",
+    "full_name",
+    "profile_pic_url",
+    "media_count",
+    "follower_count",
+    "following_count",
+    "biography",
+    "public_email",
+    "public_phone_number",
+    "whatsapp_number",
+)
+# A few workers starting at most one request per second keep away from Instagram's throttling
+USER_INFO_FETCHING_WORKERS = 3
+USER_INFO_REQUESTS_PER_SECOND = 1.0
+USER_INFO_CACHE = PersistentCache("instagram_users", ttl=12 * 60 * 60, max_entries=500)
+
 
 class Instagram:
-    """The class to scrape Instagram information from its official API."""
+    """
+    The class to scrape Instagram information from its official API \
+    (taking users' info from the cache by their IDs unless `bypass_cache` is set).
+
+    Users' info is fetched concurrently in a pool of `max_workers` threads, \
+    at most `requests_per_second` requests started per second \
+    (only for found users passing `subject_filter` if it is given).
+    """
     SETTINGS_FILE = "app/backend/scraping/instagram/cookie_settings.json"
 
-    def __init__(self, query):
+    def __init__(self, query, bypass_cache: bool = False,
+                 max_workers: int = USER_INFO_FETCHING_WORKERS,
+                 requests_per_second: float = USER_INFO_REQUESTS_PER_SECOND,
+                 subject_filter: Callable[[dict], bool] = None):
         self.query = query
+        self.subject_filter = subject_filter
+        self.bypass_cache = bypass_cache
+        self.max_workers = max_workers
+        self.__rate_limiter = RateLimiter(requests_per_second)
         self.__api = None
         self.__device_id = None
         self._found_subjects = {}
         self._query_matching_users = []
         self._subject_ids = []
-        self._extracted_info_about_subjects = []
         self.filtered_info_about_subjects = []
 
     def instagram(self):
@@ -36,7 +70,6 @@ class Instagram:
         self.__instagram_search_for_subjects()
         self.__instagram_get_ids_of_found_subjects()
         self.__instagram_extract_info_with_subject_ids()
-        self.__instagram_filter_info_about_subjects()
 
     def __instagram_authenticate(self):
         """Authenticate and create/re-use cookie file to avoid throttling."""
@@ -83,35 +116,53 @@ class Instagram:
         """Get IDs of found Instagram users."""
         users_info_as_list = self._found_subjects["users"]
         for user_as_dict in users_info_as_list:
+            if self.subject_filter is not None and not self.subject_filter(user_as_dict):
+                continue
             user_id = user_as_dict["pk"]
             self._subject_ids.append(user_id)
 
     def __instagram_extract_info_with_subject_ids(self):
-        """Extract more info about found Instagram users using their IDs."""
-        for subject_id in self._subject_ids:
-            subject_extracted_info_as_dict = self.__api.user_info(subject_id)
-            subject_extracted_info = subject_extracted_info_as_dict["user"]
-            self._extracted_info_about_subjects.append(subject_extracted_info)
-
-    def __instagram_filter_info_about_subjects(self):
-        """Filter found information about subjects saving only information \
-        with specific keys (see code)."""
-        for info_about_subject in self._extracted_info_about_subjects:
-            sorted_dictionary = {
-                k: v
-                for k, v in info_about_subject.items()
-                if k
-                in [
-                    "username",
-                    "full_name",
-                    "profile_pic_url",
-                    "media_count",
-                    "follower_count",
-                    "following_count",
-                    "biography",
-                    "public_email",
-                    "public_phone_number",
-                    "whatsapp_number",
-                ]
-            }
-            self.filtered_info_about_subjects.append(sorted_dictionary)
+        """
+        Extract more info about found Instagram users using their IDs concurrently \
+        (in the order of the search) and filter it.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            self.filtered_info_about_subjects.extend(
+                pool.map(self.__instagram_extract_info_with_subject_id, self._subject_ids)
+            )
+
+    def __instagram_extract_info_with_subject_id(self, subject_id: int) -> dict:
+        """
+        Extract more info about a found Instagram user from the cache \
+        or from API within the rate limit and filter it \
+        (see `__instagram_filter_info_about_subject`).
+
+        Args:
+            `subject_id`: the ID of the user.
+        Returns:
+            `dict`: the filtered user info.
+        """
+        if not self.bypass_cache:
+            subject_extracted_info = USER_INFO_CACHE.get(str(subject_id))
+            if subject_extracted_info is not None:
+                return subject_extracted_info
+        self.__rate_limiter.wait()
+        subject_extracted_info_as_dict = self.__api.user_info(subject_id)
+        subject_extracted_info = self.__instagram_filter_info_about_subject(
+            subject_extracted_info_as_dict["user"]
+        )
+        USER_INFO_CACHE.set(str(subject_id), subject_extracted_info)
+        return subject_extracted_info
+
+    @staticmethod
+    def __instagram_filter_info_about_subject(info_about_subject: dict) -> dict:
+        """
+        Filter found information about a subject saving only information \
+        with specific keys (see code).
+
+        Args:
+            `info_about_subject`: the user info from API.
+        Returns:
+            `dict`: the filtered user info.
+        """
+        return {k: v for k, v in info_about_subject.items() if k in USER_INFO_KEYS}
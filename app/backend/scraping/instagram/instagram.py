@@ -1,20 +1,33 @@
 # -*- coding: utf-8 -*-
 """The main Instagram scraping module."""
 
+from functools import partial
+
+from app.backend.analyzing.instagram._instagram_class import InstagramAnalyze
 from app.backend.scraping.instagram._instagram_class import Instagram
 
 
-def caller_instagram(query: str) -> dict:
+def caller_instagram(query: str, bypass_cache: bool = False,
+                     pushdown_user_input: dict = None) -> dict:
     """
     Call other Instagram scraping functions to get filtered info about person.
 
     Args:
-        `query`: the query to run Instagram API and filtering functions against.
+        `query`: the query to run Instagram API and filtering functions against.\n
+        `bypass_cache`: fetch all users' info from API instead of the cache.\n
+        `pushdown_user_input`: if given, the nickname filter of the analysis runs against \
+        this user input on search results, and users' info is scraped only for users \
+        passing it (the analysis gives the same results with fewer requests).
     Returns:
         `dict`: the dictionary with potential information about a desired person.
     """
     results_to_filter = {}
-    instagram_object = Instagram(query)
+    subject_filter = None
+    if pushdown_user_input is not None:
+        subject_filter = partial(
+            InstagramAnalyze.instagram_nick_or_name_matches, user_input=pushdown_user_input
+        )
+    instagram_object = Instagram(query, bypass_cache=bypass_cache, subject_filter=subject_filter)
     instagram_object.instagram()
     filtered_info = instagram_object.filtered_info_about_subjects
     results_to_filter["instagram"] = filtered_info
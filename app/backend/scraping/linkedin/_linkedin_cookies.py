@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""The LinkedIn scraping module to handle the session cookies file."""
+
+import json
+import os
+import tempfile
+import time
+from typing import Optional
+
+from requests.cookies import RequestsCookieJar, create_cookie
+
+# The cookie LinkedIn API requests are authorized with
+SESSION_COOKIE = "JSESSIONID"
+
+
+def _save_cookies(cookies, login: str, cookies_file: str):
+    """
+    Save the session cookies to the file atomically, readable only by the owner.
+
+    Args:
+        `cookies`: the cookie jar of the authenticated session.\n
+        `login`: the LinkedIn login the cookies belong to.\n
+        `cookies_file`: the path of the cookies file.
+    """
+    serialized_cookies = [
+        {
+            "name": cookie.name,
+            "value": cookie.value,
+            "domain": cookie.domain,
+            "path": cookie.path,
+            "expires": cookie.expires,
+            "secure": cookie.secure,
+            "rest": cookie._rest,  # pylint: disable=protected-access
+        }
+        for cookie in cookies
+    ]
+    directory = os.path.dirname(os.path.abspath(cookies_file))
+    os.makedirs(directory, exist_ok=True)
+    # The temporary file is created with 0o600 permissions
+    with tempfile.NamedTemporaryFile("w", dir=directory, delete=False) as file:
+        json.dump({"login": login, "cookies": serialized_cookies}, file)
+    os.replace(file.name, cookies_file)
+
+
+def _load_cookies(login: str, cookies_file: str) -> Optional[RequestsCookieJar]:
+    """
+    Load the session cookies from the file if they belong to the login and have not expired.
+
+    Args:
+        `login`: the LinkedIn login to authenticate with.\n
+        `cookies_file`: the path of the cookies file.
+    Returns:
+        `RequestsCookieJar`: the cookie jar of the saved session or None.
+    """
+    try:
+        with open(cookies_file) as file:
+            saved_session = json.load(file)
+        if saved_session["login"] != login:
+            return None
+        cookies = RequestsCookieJar()
+        for serialized_cookie in saved_session["cookies"]:
+            cookies.set_cookie(create_cookie(**serialized_cookie))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if not _session_is_valid(cookies):
+        return None
+    return cookies
+
+
+def _delete_cookies(cookies_file: str):
+    """
+    Delete the cookies file if it is there.
+
+    Args:
+        `cookies_file`: the path of the cookies file.
+    """
+    try:
+        os.remove(cookies_file)
+    except FileNotFoundError:
+        pass
+
+
+def _session_is_accepted(client) -> bool:
+    """
+    Check with one cheap request (the profile of the user) that LinkedIn accepts the session: \
+    saved cookies stop working before they expire if the session is revoked \
+    (a logout, a password change or a security challenge).
+
+    Args:
+        `client`: the ``linkedin_api`` client with the session cookies.
+    Returns:
+        `bool`: True if the request is authorized.
+    """
+    response = client.session.get(f"{client.API_BASE_URL}/me")
+    return response.status_code == 200
+
+
+def _session_is_valid(cookies: RequestsCookieJar) -> bool:
+    """
+    Check that the session cookie is there and has not expired.
+
+    Args:
+        `cookies`: the cookie jar of the saved session.
+    Returns:
+        `bool`: True if the session can be reused.
+    """
+    now = time.time()
+    return any(
+        cookie.name == SESSION_COOKIE and cookie.value and (cookie.expires or 0) > now
+        for cookie in cookies
+    )
+
+
+class _UnsavedCookieRepository:
+    """
+    The cookie repository of ``linkedin_api`` that neither saves nor gives cookies: \
+    the library would pickle the session cookies next to its package \
+    with default permissions, they are kept only in the protected cookies file.
+    """
+    @staticmethod
+    def save(cookies, username):  # pylint: disable=unused-argument
+        """
+        Drop the session cookies.
+
+        Args:
+            `cookies`: the cookie jar of the authenticated session.\n
+            `username`: the LinkedIn login the cookies belong to.
+        """
+
+    @staticmethod
+    def get(username):  # pylint: disable=unused-argument
+        """
+        Give no cached session cookies.
+
+        Args:
+            `username`: the LinkedIn login to authenticate with.
+        Returns:
+            `None`: there are no cookies cached by the library.
+        """
+        return None
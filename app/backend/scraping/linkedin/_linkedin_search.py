@@ -2,13 +2,25 @@
 """The LinkedIn subjects' subjects' searching module."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 from linkedin_api import Linkedin as LinkedinAPI
 
+from app.backend.scraping.linkedin._linkedin_cookies import (
+    _UnsavedCookieRepository,
+    _delete_cookies,
+    _load_cookies,
+    _save_cookies,
+    _session_is_accepted,
+)
+
 
 class LinkedinSearch:
     """
     The class to search for subjects and put them into `found` and `potential` categories.
     """
+    COOKIES_FILE = "app/backend/scraping/linkedin/cookies.json"
+
     def __init__(self, user_input):
         self.first_name = user_input["first_name"]
         self.last_name = user_input["last_name"]
@@ -27,8 +39,30 @@ class LinkedinSearch:
         self.__linkedin_search_for_subjects()
 
     def __linkedin_authenticate(self):
-        """Authenticate using LinkedIn login and password."""
-        self._api = LinkedinAPI(os.getenv("LINKEDIN_LOGIN"), os.getenv("LINKEDIN_PASSWORD"))
+        """
+        Authenticate with the saved session cookies while they have not expired \
+        and LinkedIn accepts them, otherwise using LinkedIn login and password \
+        and save the new session cookies.
+        """
+        login = os.getenv("LINKEDIN_LOGIN")
+        cookies = _load_cookies(login, LinkedinSearch.COOKIES_FILE)
+        if cookies is not None:
+            self._api = LinkedinAPI(login, os.getenv("LINKEDIN_PASSWORD"), cookies=cookies)
+            if _session_is_accepted(self._api.client):
+                return
+            # The session is revoked (linkedin_api would quietly find nothing with it)
+            _delete_cookies(LinkedinSearch.COOKIES_FILE)
+        # Cookies do not exist, have expired or are revoked
+        # (linkedin_api neither reads nor writes its own cookies cache:
+        # it fails on expired cookies and saves them with default permissions)
+        self._api = LinkedinAPI(
+            login, os.getenv("LINKEDIN_PASSWORD"), authenticate=False, refresh_cookies=True
+        )
+        self._api.client._cookie_repository = (  # pylint: disable=protected-access
+            _UnsavedCookieRepository()
+        )
+        self._api.client.authenticate(login, os.getenv("LINKEDIN_PASSWORD"))
+        _save_cookies(self._api.client.cookies, login, LinkedinSearch.COOKIES_FILE)
 
     def __linkedin_search_for_subjects(self):
         """
@@ -53,30 +87,28 @@ class LinkedinSearch:
 
     def __linkedin_search_for_potential_candidate(self):
         """
-        Search for potential candidates with any provided information.
+        Search for potential candidates with any provided information \
+        (by the company, the school and the job title separately and concurrently).
         """
-        for i in range(3):
-            try:
-                # TODO: allow code duplication, but make code more explicit
-                results = self._api.search_people(
+        applicable_searches = [
+            {keyword_name: keyword}
+            for keyword_name, keyword in (
+                ("keyword_company", self.keyword_company),
+                ("keyword_school", self.keyword_school),
+                ("keyword_title", self.keyword_title),
+            )
+            if keyword
+        ]
+        if not applicable_searches:
+            return
+        with ThreadPoolExecutor(max_workers=len(applicable_searches)) as pool:
+            results_of_searches = pool.map(
+                lambda keywords: self._api.search_people(
                     keyword_first_name=self.first_name,
                     keyword_last_name=self.last_name,
-                    keyword_company=None
-                    if i != 0
-                    else self.keyword_company
-                    if self.keyword_company
-                    else 1 / 0,
-                    keyword_school=None
-                    if i != 1
-                    else self.keyword_school
-                    if self.keyword_school
-                    else 1 / 0,
-                    keyword_title=None
-                    if i != 2
-                    else self.keyword_title
-                    if self.keyword_title
-                    else 1 / 0,
-                )
-            except ZeroDivisionError:
-                continue
-            self._potential_subjects.extend(results)
+                    **keywords,
+                ),
+                applicable_searches,
+            )
+            for results in results_of_searches:
+                self._potential_subjects.extend(results)
@@ -1,24 +1,43 @@
 # -*- coding: utf-8 -*-
 """The LinkedIn scraping module to search for info of filtered subjects."""
 
+from concurrent.futures import ThreadPoolExecutor
+
+from app.backend.scraping.helpers.persistent_cache import PersistentCache
+from app.backend.scraping.helpers.profile_projection import project_profile
+from app.backend.scraping.helpers.rate_limiter import RateLimiter
 from app.backend.scraping.linkedin._linkedin_find_ids import LinkedinFindIds
 
 IDS_IDX = 0
 INFO_IDX = 1
+# Each profile takes several requests with pauses inside linkedin_api,
+# so a few workers starting at most one profile per second stay within LinkedIn's limits
+PROFILE_FETCHING_WORKERS = 3
+PROFILE_REQUESTS_PER_SECOND = 1.0
+PROFILE_CACHE = PersistentCache("linkedin_profiles", ttl=12 * 60 * 60, max_entries=500)
 
 
 class LinkedinSearchSubjects(LinkedinFindIds):
-    """The class to search for info by filtered subjects' ids."""
+    """
+    The class to search for info by filtered subjects' ids \
+    (fetching profiles concurrently in a bounded pool of threads, \
+    at most `requests_per_second` of them started per second), \
+    taking the profiles from the cache by public ID unless `bypass_cache` is set.
+    """
 
-    def __init__(self, user_input):
+    def __init__(self, user_input, max_workers: int = PROFILE_FETCHING_WORKERS,
+                 requests_per_second: float = PROFILE_REQUESTS_PER_SECOND,
+                 bypass_cache: bool = False):
         super().__init__(user_input)
+        self.max_workers = max_workers
+        self.bypass_cache = bypass_cache
+        self.__rate_limiter = RateLimiter(requests_per_second)
         self.found_subjects_info = []
         self.potential_subjects_info_after_filtering = []
 
     def linkedin_search_for_info(self):
         """Search for info by filtered subjects' ids."""
         self.__linkedin_search_for_all_subjects()
-        self.__linkedin_filter_all_subjects()
 
     def __linkedin_search_for_all_subjects(self):
         """Organize API calls for all types of subjects: found and potential."""
@@ -33,41 +52,29 @@ class LinkedinSearchSubjects(LinkedinFindIds):
             ),
         )
 
-        for dictionary_as_instructions in searching_instructions:
-            list_of_ids = dictionary_as_instructions[IDS_IDX]
-            list_to_append_subjects = dictionary_as_instructions[INFO_IDX]
-            for subject_id in list_of_ids:
-                subject_info = self._api.get_profile(subject_id)
-                list_to_append_subjects.append(subject_info)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for dictionary_as_instructions in searching_instructions:
+                list_of_ids = dictionary_as_instructions[IDS_IDX]
+                list_to_append_subjects = dictionary_as_instructions[INFO_IDX]
+                list_to_append_subjects.extend(
+                    pool.map(self.__linkedin_get_profile, list_of_ids)
+                )
 
-    def __linkedin_filter_all_subjects(self):
+    def __linkedin_get_profile(self, subject_id: str) -> dict:
         """
-        Filter the information from API and leave only information from specific keys (see code).
+        Get the profile of the subject from the cache or from API within the rate limit \
+        and leave only information the app uses (see `LINKEDIN_PROFILE_PROJECTION`).
+
+        Args:
+            `subject_id`: the public ID of the subject.
+        Returns:
+            `dict`: the filtered profile of the subject.
         """
-        filtering_lists = [
-            self.found_subjects_info,
-            self.potential_subjects_info_after_filtering,
-        ]
-        for list_to_filter in filtering_lists:
-            for i, returned_obj in enumerate(list_to_filter):
-                standardized_properties = {
-                    k: v
-                    for k, v in returned_obj.items()
-                    if k in [
-                        "industryName",
-                        "lastName",
-                        "locationName",
-                        "student",
-                        "geoCountryName",
-                        "firstName",
-                        "headline",
-                        "experience",
-                        "skills",
-                        "education",
-                        "languages",
-                        "publications",
-                        "certifications",
-                        "honors",
-                    ]
-                }
-                list_to_filter[i] = standardized_properties
+        if not self.bypass_cache:
+            cached_profile = PROFILE_CACHE.get(subject_id)
+            if cached_profile is not None:
+                return cached_profile
+        self.__rate_limiter.wait()
+        projected_profile = project_profile(self._api.get_profile(subject_id))
+        PROFILE_CACHE.set(subject_id, projected_profile)
+        return projected_profile
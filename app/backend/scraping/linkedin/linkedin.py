@@ -6,17 +6,18 @@ from app.backend.scraping.linkedin._linkedin_search_info import (
 )
 
 
-def caller_linkedin(user_input: dict) -> dict:
+def caller_linkedin(user_input: dict, bypass_cache: bool = False) -> dict:
     """
     Call LinkedIn scraping methods to get info about found and potential subjects.
 
     Args:
-        `user_input`: user input represented as a dictionary.
+        `user_input`: user input represented as a dictionary.\n
+        `bypass_cache`: fetch all profiles from API instead of the profile cache.
     Returns:
         `dict`: the dictionary with information about found or potential subjects.
     """
     results_to_filter = {}
-    linkedin_obj = LinkedinSearchSubjects(user_input)
+    linkedin_obj = LinkedinSearchSubjects(user_input, bypass_cache=bypass_cache)
     linkedin_obj.linkedin_search()
     linkedin_obj.linkedin_find_ids()
     linkedin_obj.linkedin_search_for_info()
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""The XPATH scraping module to parse HTML incrementally while it is being downloaded."""
+
+import codecs
+import re
+from typing import Optional
+
+from lxml import etree, html
+
+from app.backend.scraping.scraper._scraper_engine import ParseWorker, ScraperSettings
+from app.backend.scraping.scraper._xpath_registry import SiteSelectors
+
+DEFAULT_ENCODING = "utf-8"
+# Encodings declared in the beginning of the webpage (like browsers do, in its first 1024 bytes)
+_SNIFFING_SIZE = 1024
+_META_CHARSET_REGEX = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([A-Za-z0-9._:-]+)""", re.I)
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+async def stream_html_tree(session, link: str, selectors: SiteSelectors,
+                           settings: ScraperSettings, parse_worker: ParseWorker):
+    """
+    Download the webpage and feed its chunks into an incremental HTML parser \
+    (in the parsing thread of the webpage) as they arrive, without buffering the whole body.
+
+    Args:
+        `session`: aiohttp session.\n
+        `link`: the link to the desired webpage.\n
+        `selectors`: compiled XPATH selectors of the webpage \
+        (to stop downloading once all of them are resolvable).\n
+        `settings`: the scraper settings with the body size cap, \
+        ``Content-Type`` whitelist and chunk size.\n
+        `parse_worker`: the worker to run all parsing of the webpage in.
+    Returns:
+        `html_tree`: HTML tree of the webpage (possibly of its beginning only \
+        if `settings.stop_when_resolved` is set).
+    Raises:
+        ``ValueError``: if the ``Content-Type`` is not whitelisted \
+        or the body exceeds the size cap.
+    """
+    async with session.get(link) as response:
+        response.raise_for_status()
+        _check_content_type(response.content_type, settings)
+        if response.content_length is not None:
+            _check_body_size(response.content_length, settings)
+        parser = await parse_worker.run(_IncrementalHtmlParser, response.charset)
+        selectors_to_resolve = selectors if settings.stop_when_resolved else None
+        received_size = 0
+        async for chunk in response.content.iter_chunked(settings.chunk_size):
+            received_size += len(chunk)
+            _check_body_size(received_size, settings)
+            if await parse_worker.run(parser.feed, chunk, selectors_to_resolve):
+                break
+    return await parse_worker.run(parser.close)
+
+
+class _IncrementalHtmlParser:
+    """
+    The class to build an HTML tree from chunks and look into it before the end.
+
+    Chunks are decoded before parsing with the encoding found on the first chunk: \
+    by the byte order mark, the charset of the ``Content-Type`` header, \
+    the charset of the ``<meta>`` tag or UTF-8 (the first one that is there and known).
+    """
+    def __init__(self, charset: str = None):
+        self.charset = charset
+        self.__parser = etree.HTMLPullParser(events=("start",), tag="html")
+        self.__parser.set_element_class_lookup(html.HtmlElementClassLookup())
+        self.__decoder = None
+        self.__root = None
+
+    def feed(self, chunk: bytes, selectors: SiteSelectors = None) -> bool:
+        """
+        Feed the chunk into the parser and check whether downloading can be stopped.
+
+        Args:
+            `chunk`: the received chunk of the body.\n
+            `selectors`: compiled XPATH selectors that all have to be resolvable \
+            to stop downloading (never stop if not given).
+        Returns:
+            `bool`: True if all fields are already resolvable.
+        """
+        if self.__decoder is None:
+            encoding = _sniff_encoding(chunk, self.charset)
+            self.__decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self.__parser.feed(self.__decoder.decode(chunk))
+        for _, element in self.__parser.read_events():
+            if self.__root is None:
+                self.__root = element.getroottree().getroot()
+        if selectors is None or self.__root is None:
+            return False
+        return _all_fields_resolvable(self.__root, selectors)
+
+    def close(self):
+        """
+        Finish parsing.
+
+        Returns:
+            `html_tree`: HTML tree of the received part of the webpage.
+        """
+        if self.__decoder is not None:
+            self.__parser.feed(self.__decoder.decode(b"", final=True))
+        return self.__parser.close()
+
+
+def _sniff_encoding(first_chunk: bytes, charset: str = None) -> str:
+    """
+    Find the encoding of the webpage by its byte order mark, the declared charset \
+    or the charset of its ``<meta>`` tag.
+
+    Args:
+        `first_chunk`: the first received chunk of the body.\n
+        `charset`: the charset of the ``Content-Type`` header (if any).
+    Returns:
+        `str`: the name of an encoding known to Python (UTF-8 if nothing else is found).
+    """
+    for bom, encoding in _BOMS:
+        if first_chunk.startswith(bom):
+            return encoding
+    declared_encoding = _known_encoding(charset)
+    if declared_encoding:
+        return declared_encoding
+    meta_charset_match = _META_CHARSET_REGEX.search(first_chunk[:_SNIFFING_SIZE])
+    if meta_charset_match:
+        meta_encoding = _known_encoding(meta_charset_match.group(1).decode("ascii"))
+        if meta_encoding:
+            return meta_encoding
+    return DEFAULT_ENCODING
+
+
+def _known_encoding(charset: Optional[str]) -> Optional[str]:
+    """
+    Get the name of the encoding of the charset if Python knows it.
+
+    Args:
+        `charset`: the name of the charset (if any).
+    Returns:
+        `str`: the name of the encoding or None if the charset is missing or unknown.
+    """
+    if not charset:
+        return None
+    try:
+        return codecs.lookup(charset).name
+    except LookupError:
+        return None
+
+
+def _check_content_type(content_type: str, settings: ScraperSettings):
+    """
+    Check that the ``Content-Type`` of the response is whitelisted.
+
+    Args:
+        `content_type`: the MIME type of the response (without parameters).\n
+        `settings`: the scraper settings with the ``Content-Type`` whitelist.
+    Raises:
+        ``ValueError``: if the ``Content-Type`` is not whitelisted.
+    """
+    if content_type not in settings.allowed_content_types:
+        raise ValueError(f"the Content-Type {content_type!r} is not allowed")
+
+
+def _check_body_size(body_size: int, settings: ScraperSettings):
+    """
+    Check that the size of the response body does not exceed the cap.
+
+    Args:
+        `body_size`: the (received or declared) size of the body in bytes.\n
+        `settings`: the scraper settings with the body size cap.
+    Raises:
+        ``ValueError``: if the body exceeds the size cap.
+    """
+    if body_size > settings.max_body_size:
+        raise ValueError(f"the body exceeds {settings.max_body_size} bytes")
+
+
+def _all_fields_resolvable(html_tree, selectors: SiteSelectors) -> bool:
+    """
+    Check whether every field's XPATH selector already finds elements \
+    on the partially parsed webpage, and all of them are parsed to their end tags.
+
+    Args:
+        `html_tree`: HTML tree of the part of the webpage received so far.\n
+        `selectors`: compiled XPATH selectors of the webpage.
+    Returns:
+        `bool`: True if downloading can be stopped.
+    """
+    for _, xpath, _ in selectors.fields:
+        scraped = xpath(html_tree)
+        if not scraped:
+            return False
+        if isinstance(scraped, list) and not all(map(_is_parsed, scraped)):
+            return False
+    return True
+
+
+def _is_parsed(scraped_item) -> bool:
+    """
+    Check whether the found element (or its text or attribute) cannot change anymore: \
+    the parser has moved past the element, so the element or one of its ancestors \
+    has a following sibling.
+
+    Args:
+        `scraped_item`: the element or the string found by an XPATH selector.
+    Returns:
+        `bool`: True if the item is complete (False for strings without their element).
+    """
+    if etree.iselement(scraped_item):
+        element = scraped_item
+    elif hasattr(scraped_item, "getparent"):
+        element = scraped_item.getparent()
+        if element is not None and scraped_item.is_tail:
+            # The tail ends where the next sibling starts or where the parent ends
+            if element.getnext() is not None:
+                return True
+            element = element.getparent()
+    else:
+        return False
+    while element is not None:
+        if element.getnext() is not None:
+            return True
+        element = element.getparent()
+    return False
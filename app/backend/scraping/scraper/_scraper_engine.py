@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""The XPATH scraping module with the engine holding one pooled HTTP session."""
+
+import asyncio
+import atexit
+import itertools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import NamedTuple
+from urllib.parse import urlsplit
+
+import aiohttp
+
+
+class ScraperSettings(NamedTuple):
+    """
+    The connection pool, concurrency, timeout and HTML parsing settings \
+    of the scraper engine.
+
+    With `streaming` set, response chunks are fed into an incremental parser as they \
+    arrive, the body is capped at `max_body_size` bytes and only `allowed_content_types` \
+    are parsed. `stop_when_resolved` stops downloading as soon as every field's selector \
+    finds something parsed to its end tag, so fields with many values may be cut \
+    to those received by then.
+
+    HTML parsing and XPATH evaluation run in a pool of `parse_workers` threads \
+    (lxml releases the GIL while parsing); with ``0`` workers they run on the event loop.
+    """
+    max_concurrency: int = 100
+    max_concurrency_per_host: int = 10
+    dns_cache_ttl: int = 300
+    keepalive_timeout: float = 30
+    connect_timeout: float = 10
+    read_timeout: float = 20
+    batch_deadline: float = 60
+    streaming: bool = True
+    chunk_size: int = 64 * 1024
+    max_body_size: int = 5 * 1024 * 1024
+    allowed_content_types: tuple = ("text/html", "application/xhtml+xml")
+    stop_when_resolved: bool = False
+    parse_workers: int = 4
+    loop_monitor_interval: float = 0.005
+
+
+class ParseWorker:
+    """
+    The class to run CPU-bound parsing functions of one webpage in one parsing thread \
+    (or on the event loop itself if there is no thread).
+    """
+    def __init__(self, executor: ThreadPoolExecutor = None):
+        self.__executor = executor
+
+    async def run(self, function, *args):
+        """
+        Run the parsing function in the worker's thread.
+
+        Args:
+            `function`: the parsing function.\n
+            `*args`: the arguments of the function.
+        Returns:
+            `object`: the result of the function.
+        """
+        if self.__executor is None:
+            return function(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.__executor, function, *args)
+
+    def shutdown(self):
+        """Stop the worker's thread."""
+        if self.__executor is not None:
+            self.__executor.shutdown()
+
+
+class _LoopState:
+    """The pooled session, concurrency limits and blocking monitor bound to one event loop."""
+    def __init__(self, session: aiohttp.ClientSession, max_concurrency: int):
+        self.session = session
+        self.global_semaphore = asyncio.Semaphore(max_concurrency)
+        self.host_semaphores = {}
+        self.active_batches = 0
+        self.monitor_task = None
+
+
+class ScraperEngine:
+    """
+    The class to hold one long-lived aiohttp session (keep-alive connection pool \
+    and DNS cache) per event loop that is reused by every scraping run in the process, \
+    together with the global and per-host concurrency limits and the pool of parsing threads.
+
+    `loop_blocked_time` accumulates the seconds the event loop was blocked \
+    (not able to switch tasks) while scraping batches were running.
+    """
+    def __init__(self, settings: ScraperSettings = ScraperSettings()):
+        self.settings = settings
+        self.loop_blocked_time = 0.0
+        self.__own_loop = None
+        self.__loop_states = weakref.WeakKeyDictionary()
+        self.__parse_workers = []
+        self.__parse_turns = None
+        atexit.register(self.__close_at_exit)
+
+    def run(self, coroutine):
+        """
+        Run a coroutine to completion on the engine's own event loop \
+        (for synchronous callers that are not running any event loop).
+
+        Args:
+            `coroutine`: the coroutine to run.
+        Returns:
+            `object`: the result of the coroutine.
+        Raises:
+            ``RuntimeError``: if called while an event loop is running in this thread.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            coroutine.close()
+            raise RuntimeError(
+                "The synchronous scraping API cannot be called from a running event loop, "
+                "await the coroutine API instead."
+            )
+        if self.__own_loop is None or self.__own_loop.is_closed():
+            self.__own_loop = asyncio.new_event_loop()
+        return self.__own_loop.run_until_complete(coroutine)
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the pooled session of the running event loop, creating it on the first call.
+
+        Returns:
+            `aiohttp.ClientSession`: the session bound to the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        loop_state = self.__loop_states.get(loop)
+        if loop_state is None or loop_state.session.closed:
+            loop_state = _LoopState(self.__create_session(), self.settings.max_concurrency)
+            self.__loop_states[loop] = loop_state
+        return loop_state.session
+
+    def get_semaphores(self, link: str) -> tuple:
+        """
+        Get the global semaphore and the semaphore of the link's host \
+        (call after `get_session` on the same event loop).
+
+        Args:
+            `link`: the link to the desired webpage.
+        Returns:
+            `tuple`: the global semaphore and the per-host semaphore.
+        """
+        loop_state = self.__loop_states[asyncio.get_running_loop()]
+        host = urlsplit(link).hostname
+        if host not in loop_state.host_semaphores:
+            loop_state.host_semaphores[host] = asyncio.Semaphore(
+                self.settings.max_concurrency_per_host
+            )
+        return loop_state.global_semaphore, loop_state.host_semaphores[host]
+
+    def assign_parse_worker(self) -> "ParseWorker":
+        """
+        Assign the next parsing thread in turn to a webpage \
+        (an lxml parser and its tree must stay in the thread that created them).
+
+        Returns:
+            `ParseWorker`: the worker to run all parsing of the webpage in.
+        """
+        if not self.settings.parse_workers:
+            return ParseWorker()
+        if not self.__parse_workers:
+            self.__parse_workers = [
+                ParseWorker(ThreadPoolExecutor(max_workers=1, thread_name_prefix="scraper-parse"))
+                for _ in range(self.settings.parse_workers)
+            ]
+            self.__parse_turns = itertools.cycle(self.__parse_workers)
+        return next(self.__parse_turns)
+
+    @asynccontextmanager
+    async def monitoring_loop_blocking(self):
+        """
+        Measure how long the event loop is blocked while the scraping batch is running \
+        (one monitor per event loop, however many batches run concurrently).
+        """
+        loop_state = self.__loop_states[asyncio.get_running_loop()]
+        loop_state.active_batches += 1
+        if loop_state.monitor_task is None:
+            loop_state.monitor_task = asyncio.ensure_future(self.__monitor_loop_blocking())
+        try:
+            yield
+        finally:
+            loop_state.active_batches -= 1
+            if not loop_state.active_batches:
+                loop_state.monitor_task.cancel()
+                loop_state.monitor_task = None
+
+    async def __monitor_loop_blocking(self):
+        """Add up the delays of the event loop waking up the monitor until cancelled."""
+        loop = asyncio.get_running_loop()
+        interval = self.settings.loop_monitor_interval
+        while True:
+            started = loop.time()
+            await asyncio.sleep(interval)
+            self.loop_blocked_time += max(0.0, loop.time() - started - interval)
+
+    async def close(self):
+        """
+        Close the pooled session of the running event loop \
+        and release all its kept-alive connections.
+        """
+        loop_state = self.__loop_states.pop(asyncio.get_running_loop(), None)
+        if loop_state is not None and not loop_state.session.closed:
+            await loop_state.session.close()
+
+    def __close_at_exit(self):
+        """
+        Close the pooled sessions of the event loops that are still usable \
+        and the engine's own event loop on interpreter exit.
+        """
+        for loop, loop_state in list(self.__loop_states.items()):
+            if not loop.is_closed() and not loop.is_running():
+                loop.run_until_complete(loop_state.session.close())
+        self.__loop_states.clear()
+        for parse_worker in self.__parse_workers:
+            parse_worker.shutdown()
+        if self.__own_loop is not None and not self.__own_loop.is_closed():
+            self.__own_loop.close()
+
+    def __create_session(self) -> aiohttp.ClientSession:
+        """
+        Create a session with a keep-alive connector and cached DNS resolution.
+
+        Returns:
+            `aiohttp.ClientSession`: the newly created session.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self.settings.max_concurrency,
+            limit_per_host=self.settings.max_concurrency_per_host,
+            use_dns_cache=True,
+            ttl_dns_cache=self.settings.dns_cache_ttl,
+            keepalive_timeout=self.settings.keepalive_timeout,
+            resolver=self.__create_resolver(),
+        )
+        timeout = aiohttp.ClientTimeout(
+            sock_connect=self.settings.connect_timeout,
+            sock_read=self.settings.read_timeout,
+        )
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    @staticmethod
+    def __create_resolver():
+        """
+        Create the aiodns-backed resolver or fall back to the default one.
+
+        Returns:
+            `AbstractResolver`: the resolver for the connector.
+        """
+        try:
+            return aiohttp.AsyncResolver()
+        except RuntimeError:
+            # aiodns is not installed
+            return aiohttp.DefaultResolver()
+
+
+_ENGINE = ScraperEngine()
+
+
+def get_scraper_engine() -> ScraperEngine:
+    """
+    Get the process-wide scraper engine.
+
+    Returns:
+        `ScraperEngine`: the engine shared by all scraping runs in the process.
+    """
+    return _ENGINE
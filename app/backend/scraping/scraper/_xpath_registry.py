@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""The XPATH scraping module to compile site configs from params files."""
+
+from typing import NamedTuple, Optional, Tuple
+
+from lxml import etree
+
+
+class FieldSelector(NamedTuple):
+    """The compiled XPATH selector of one field with an optional endpoint to prepend."""
+    field: str
+    xpath: etree.XPath
+    endpoint: Optional[str]
+
+
+class SiteSelectors(NamedTuple):
+    """The compiled, immutable config of one site from a params file."""
+    service_name: str
+    fields: Tuple[FieldSelector, ...]
+
+
+def compile_site_config(conf: dict) -> SiteSelectors:
+    """
+    Compile keys and XPATH selectors of one site into immutable XPath objects.
+
+    Args:
+        `conf`: keys and XPATH selectors (optionally as ``{endpoint: xpath}``) \
+        with the ``service_name`` key.
+    Returns:
+        `SiteSelectors`: the service name with compiled selectors of all fields.
+    Raises:
+        ``lxml.etree.XPathSyntaxError``: if any of the XPATH selectors is invalid.
+    """
+    fields = []
+    for field, xpath_or_with_endpoint in conf.items():
+        if field == "service_name":
+            continue
+        if isinstance(xpath_or_with_endpoint, dict):
+            ((endpoint, xpath),) = xpath_or_with_endpoint.items()
+        else:
+            xpath = xpath_or_with_endpoint
+            endpoint = None
+        fields.append(FieldSelector(field, etree.XPath(xpath), endpoint))
+    return SiteSelectors(conf["service_name"], tuple(fields))
+
+
+def compile_params(file_contents: dict) -> dict:
+    """
+    Compile all site configs of a params file.
+
+    Args:
+        `file_contents`: JSON-loaded contents of a params file \
+        (link regexes mapped to site configs).
+    Returns:
+        `dict`: link regexes mapped to compiled `SiteSelectors`.
+    """
+    return {
+        link_regex: compile_site_config(conf)
+        for link_regex, conf in file_contents.items()
+    }
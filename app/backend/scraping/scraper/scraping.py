@@ -1,12 +1,14 @@
 # -*- coding: utf-8 -*-
 """The main XPATH scraping module."""
 
-from typing import Tuple, Union, Any
 import asyncio
 import aiohttp
-import nest_asyncio
 
-from lxml import html
+from lxml import etree, html
+
+from app.backend.scraping.scraper._html_streaming import stream_html_tree
+from app.backend.scraping.scraper._scraper_engine import ScraperEngine, get_scraper_engine
+from app.backend.scraping.scraper._xpath_registry import SiteSelectors, compile_site_config
 
 
 def scraping(list_of_links_and_configs: list) -> list:
@@ -14,63 +16,175 @@ def scraping(list_of_links_and_configs: list) -> list:
     Take the list of links and configurations (XPATH selectors) \
     and return scraped elements from webpages.
 
+    The synchronous shim over `scrape_many` for callers without an event loop.
+
     Args:
          `list_of_links_and_configs`: the list of links to webpages \
          with XPATH selectors from params files.
     Returns:
-         `list`: the list of links with elements that are scraped using XPATH selectors.
+         `list`: the list of links with elements that are scraped using XPATH selectors \
+         (or error records for links that failed, see `scrape_many`).
     """
-    results = []
-    loop = asyncio.get_event_loop()
-    nest_asyncio.apply(loop)
-    responses = loop.run_until_complete(
-        _organize_tasks(loop, *list_of_links_and_configs)
-    )
-    for response in responses:
-        results.append(response)
-    return results
+    return get_scraper_engine().run(scrape_many(list_of_links_and_configs))
 
 
-async def _organize_tasks(loop, *tuples_of_links_and_configs) -> Tuple[
-        Union[BaseException, Any], Union[BaseException, Any], Union[BaseException, Any],
-        Union[BaseException, Any], Union[BaseException, Any]
-]:
+async def scrape_many(list_of_links_and_configs: list, engine: ScraperEngine = None) -> list:
     """
-    Take asyncio event loop and tuples of links and configs, \
-    and organise asyncio.gather asynchronous activity.
+    Take the list of links and configurations (XPATH selectors) \
+    and scrape elements from webpages on the running event loop.
+
+    A link that fails or does not finish before the batch deadline does not fail \
+    the whole batch: its place in the list is taken by an error record, \
+    the dictionary with ``service_name``, ``link`` and ``error`` keys.
 
     Args:
-        `loop`: asyncio event loop.\n
+         `list_of_links_and_configs`: the list of links to webpages \
+         with XPATH selectors from params files.\n
+         `engine`: the scraper engine to use (the process-wide one by default).
+    Returns:
+         `list`: the list of links with elements that are scraped using XPATH selectors, \
+         in the order of the input list.
+    """
+    if engine is None:
+        engine = get_scraper_engine()
+    return await _organize_tasks(engine, *list_of_links_and_configs)
+
+
+def is_error_record(scraped_webpage: dict) -> bool:
+    """
+    Check whether the scraped webpage is an error record.
+
+    Args:
+        `scraped_webpage`: the dictionary returned by `scrape_many` for a link.
+    Returns:
+        `bool`: True if the link failed to be scraped.
+    """
+    return "error" in scraped_webpage
+
+
+async def _organize_tasks(engine: ScraperEngine, *tuples_of_links_and_configs) -> list:
+    """
+    Take tuples of links and configs, and run them concurrently \
+    on the engine's pooled session within the engine's batch deadline.
+
+    Args:
+        `engine`: the scraper engine with the session and concurrency limits.\n
         `*tuples_of_links_and_configs`: tuples of links to webpages with XPATH selectors \
         from params files.
 
     Returns:
-        `list`: asyncio-controlled tasks using Future.
+        `list`: scraped webpages or error records in the order of the input tuples.
+    """
+    if not tuples_of_links_and_configs:
+        return []
+    links_and_selectors = [
+        _as_link_and_selectors(tuple_of_link_and_config)
+        for tuple_of_link_and_config in tuples_of_links_and_configs
+    ]
+    session = await engine.get_session()
+    tasks = [
+        asyncio.ensure_future(_scraper(session, engine, link_and_selectors))
+        for link_and_selectors in links_and_selectors
+    ]
+    async with engine.monitoring_loop_blocking():
+        _, pending = await asyncio.wait(tasks, timeout=engine.settings.batch_deadline)
+    for task in pending:
+        task.cancel()
+    # Cancelled tasks release their semaphores and connections before the batch returns
+    await asyncio.gather(*pending, return_exceptions=True)
+    results = []
+    for task, (link, selectors) in zip(tasks, links_and_selectors):
+        if task in pending:
+            results.append(_error_record(link, selectors, "the batch deadline is exceeded"))
+        elif task.exception() is not None:
+            # An unexpected error of one link does not fail the other links of the batch
+            error = task.exception()
+            results.append(_error_record(link, selectors, f"{type(error).__name__}: {error}"))
+        else:
+            results.append(task.result())
+    return results
+
+
+async def _scraper(session, engine: ScraperEngine, link_and_selectors: tuple) -> dict:
+    """
+    Using aiohttp session and the link to the webpage with compiled XPATH selectors, \
+    scrape the webpage within the engine's concurrency limits \
+    and parse it in the engine's parsing threads.
+
+    Args:
+        `session`: aiohttp session.\n
+        `engine`: the scraper engine with the concurrency limits and parsing threads.\n
+        `link_and_selectors`: the link to the desired webpage \
+        with compiled XPATH selectors to elements on it.
+    Returns:
+        `dict`: the dictionary with link to the webpage and XPATH-scraped values \
+        or the error record if the webpage could not be scraped.
     """
-    tasks = []
-    async with aiohttp.ClientSession(loop=loop) as session:
-        for tuple_of_link_and_config in tuples_of_links_and_configs:
-            tasks.append(_scraper(session, tuple_of_link_and_config))
-        return await asyncio.gather(*tasks)
+    link, selectors = link_and_selectors
+    parse_worker = engine.assign_parse_worker()
+    try:
+        html_tree = await _download_html_tree(session, engine, link, selectors, parse_worker)
+        result = await parse_worker.run(_find_elements, link, html_tree, selectors)
+    except (aiohttp.ClientError, asyncio.TimeoutError, etree.LxmlError, ValueError) as error:
+        return _error_record(link, selectors, f"{type(error).__name__}: {error}")
+    return result
 
 
-async def _scraper(session, tuple_of_link_and_config: tuple) -> dict:
+async def _download_html_tree(session, engine: ScraperEngine, link: str,
+                              selectors: SiteSelectors, parse_worker):
     """
-    Using aiohttp session and tuple of links to webpages with XPATH selectors, \
-    scrape the webpage.
+    Download the webpage within the engine's concurrency limits and get its HTML tree, \
+    parsing it while it is being downloaded (if `streaming` is set) or after that.
 
     Args:
         `session`: aiohttp session.\n
+        `engine`: the scraper engine with the settings and concurrency limits.\n
+        `link`: the link to the desired webpage.\n
+        `selectors`: compiled XPATH selectors of the webpage.\n
+        `parse_worker`: the worker to run all parsing of the webpage in.
+    Returns:
+        `html_tree`: HTML tree of the webpage.
+    """
+    global_semaphore, host_semaphore = engine.get_semaphores(link)
+    if engine.settings.streaming:
+        async with global_semaphore, host_semaphore:
+            return await stream_html_tree(
+                session, link, selectors, engine.settings, parse_worker
+            )
+    async with global_semaphore, host_semaphore:
+        html_string = await _get_html_string(session, link)
+    # The buffered webpage is parsed after the download releases its limits
+    return await parse_worker.run(_get_html_tree, html_string)
+
+
+def _as_link_and_selectors(tuple_of_link_and_config: tuple) -> tuple:
+    """
+    Take the link with its config and compile the config if it is not compiled yet.
+
+    Args:
         `tuple_of_link_and_config`: the link to the desired webpage \
-        with XPATH selectors to elements on it.
+        with compiled `SiteSelectors` or a raw config from a params file.
     Returns:
-        `dict`: the dictionary with link to the webpage and XPATH-scraped values.
+        `tuple`: the link with compiled `SiteSelectors`.
     """
     link, config = tuple_of_link_and_config
-    html_string = await _get_html_string(session, link)
-    html_tree = await _get_html_tree(html_string)
-    result = await _find_elements(link, html_tree, config)
-    return result
+    if not isinstance(config, SiteSelectors):
+        config = compile_site_config(config)
+    return link, config
+
+
+def _error_record(link: str, selectors: SiteSelectors, error: str) -> dict:
+    """
+    Make the error record for the link that could not be scraped.
+
+    Args:
+        `link`: the link to the desired webpage.\n
+        `selectors`: compiled XPATH selectors of the webpage.\n
+        `error`: the description of the error.
+    Returns:
+        `dict`: the dictionary with ``service_name``, ``link`` and ``error`` keys.
+    """
+    return {"service_name": selectors.service_name, "link": link, "error": error}
 
 
 async def _get_html_string(session, link):
@@ -82,10 +196,11 @@ async def _get_html_string(session, link):
         `link`: the link to the desired webpage.
     """
     async with session.get(link) as response:
+        response.raise_for_status()
         return await response.text()
 
 
-async def _get_html_tree(html_string: str):
+def _get_html_tree(html_string: str):
     """
     Get a HTML tree from a HTML string.
 
@@ -97,27 +212,20 @@ async def _get_html_tree(html_string: str):
     return html.fromstring(html_string)
 
 
-async def _find_elements(link: str, html_tree, conf: dict) -> dict:
+def _find_elements(link: str, html_tree, selectors: SiteSelectors) -> dict:
     """
-    Find elements with XPATH selectors on the webpage.
+    Find elements with compiled XPATH selectors on the webpage.
 
     Args:
         `link`: the link to the desired webpage.\n
         `html_tree`: HTML tree of the webpage.\n
-        `conf`: keys and XPATH selectors to run scraping against.
+        `selectors`: compiled keys and XPATH selectors to run scraping against.
     Returns:
         `dict`: the dictionary of links with values that are scraped using XPATH selectors.
     """
-    result = {"service_name": conf["service_name"], "link": link}
-    service_name = conf.pop("service_name", None)
-    for field in conf:
-        xpath_or_with_endpoint = conf[field]
-        if isinstance(xpath_or_with_endpoint, dict):
-            ((endpoint, xpath),) = xpath_or_with_endpoint.items()
-        else:
-            xpath = xpath_or_with_endpoint
-            endpoint = None
-        scraped = html_tree.xpath(xpath)
+    result = {"service_name": selectors.service_name, "link": link}
+    for field, xpath, endpoint in selectors.fields:
+        scraped = xpath(html_tree)
         if not scraped:
             continue
 
@@ -134,5 +242,4 @@ async def _find_elements(link: str, html_tree, conf: dict) -> dict:
             scraped = scraped[0]
 
         result[field] = scraped
-    conf["service_name"] = service_name
     return result
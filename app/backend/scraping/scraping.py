@@ -10,13 +10,18 @@ from app.backend.scraping.linkedin.linkedin import caller_linkedin
 from app.backend.scraping.twitter.twitter import caller_twitter
 
 
-def main_scraping(user_input: dict) -> dict:
+def main_scraping(user_input: dict, bypass_cache: bool = False,
+                  pushdown_filters: bool = False) -> dict:
     """
     Take user input and scrape all possible information on Google Search, \
         Instagram, LinkedIn, Twitter.
 
     Args:
-        `user_input`: user input represented as a dictionary.
+        `user_input`: user input represented as a dictionary.\n
+        `bypass_cache`: fetch all profiles on Instagram, LinkedIn, Twitter \
+            from their APIs instead of the profile caches (the caches are refreshed).\n
+        `pushdown_filters`: drop subjects failing the first filters of the analysis \
+            before their details are scraped (the analysis results are the same).
     Returns:
         `dict`: all scraped information from Google Search, \
             Instagram, LinkedIn, Twitter.
@@ -28,19 +33,24 @@ def main_scraping(user_input: dict) -> dict:
     with ProcessPoolExecutor(max_workers=5) as pool:
         linkedin_process = pool.submit(
             caller_linkedin,
-            user_input=user_input
+            user_input=user_input,
+            bypass_cache=bypass_cache,
         )
         instagram_process = pool.submit(
             caller_instagram,
             query=user_input["instagram_nickname"]
-            if user_input["instagram_nickname"] else full_name
+            if user_input["instagram_nickname"] else full_name,
+            bypass_cache=bypass_cache,
+            pushdown_user_input=user_input if pushdown_filters else None,
         )
         google_search_process = pool.submit(
             caller_google_search, user_input=user_input
         )
         twitter_process = pool.submit(
             caller_twitter, query=user_input["twitter_profile"]
-            if user_input["twitter_profile"] else full_name
+            if user_input["twitter_profile"] else full_name,
+            bypass_cache=bypass_cache,
+            pushdown_user_input=user_input if pushdown_filters else None,
         )
 
     try:
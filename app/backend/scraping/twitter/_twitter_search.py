@@ -2,19 +2,41 @@
 """The Twitter scraping module to search for subjects using Twitter official API."""
 
 import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
 from tweepy.errors import TweepyException
+from app.backend.scraping.helpers.persistent_cache import PersistentCache
 from app.backend.scraping.twitter._twitter_authorize import TwitterAuthorize
 
+# The report shows the last two posts of a subject
+POSTS_COUNT = 2
+# Twitter drops replies and retweets after taking `count` posts of a timeline,
+# so a page of posts is requested to find the last posts among them
+TIMELINE_PAGE_SIZE = 20
+TIMELINE_FETCHING_WORKERS = 4
+POSTS_CACHE = PersistentCache("twitter_posts", ttl=60 * 60, max_entries=500)
+
 
 class TwitterSearch(TwitterAuthorize):
     """
-    The class to search for subjects using Twitter API, then filter subjects' info and posts.
+    The class to search for subjects using Twitter API, then filter subjects' info and posts \
+    (taking subjects' posts from the cache by their user IDs unless `bypass_cache` is set).
+
+    Only the last `posts_count` posts of a subject are kept, without replies and retweets \
+    (from a page of at least ``TIMELINE_PAGE_SIZE`` posts), concurrently for all subjects \
+    (or only for subjects passing `subject_filter` if it is given).
     """
-    def __init__(self, query):
+    def __init__(self, query, bypass_cache: bool = False, posts_count: int = POSTS_COUNT,
+                 subject_filter: Callable[[dict], bool] = None):
         super().__init__()
         self.query = query
+        self.bypass_cache = bypass_cache
+        self.posts_count = posts_count
+        self.subject_filter = subject_filter
         self._found_subjects = []
         self._found_subjects_info = []
+        self._subject_ids = []
         self._subject_screen_name = []
         self.filtered_subjects_info = []
         self.subjects_posts_text = []
@@ -56,22 +78,61 @@ class TwitterSearch(TwitterAuthorize):
                     "url",
                 ]
             }
+            if self.subject_filter is not None and not self.subject_filter(filtered_subject_info):
+                continue
             self.filtered_subjects_info.append(filtered_subject_info)
+            self._subject_ids.append(subject_info["id_str"])
             self._subject_screen_name.append(filtered_subject_info["screen_name"])
 
     def __twitter_get_and_filter_subjects_posts(self):
         """
+        Get subjects' posts using their screen names concurrently, \
+        then run posts against the regex filters (no posts for subjects whose posts \
+        are not available).
+        """
+        with ThreadPoolExecutor(max_workers=TIMELINE_FETCHING_WORKERS) as pool:
+            subjects_posts_text = pool.map(
+                self.__twitter_get_and_filter_subject_posts,
+                self._subject_ids,
+                self._subject_screen_name,
+            )
+            for list_for_subject_posts_text in subjects_posts_text:
+                # Subjects without available posts (e.g. protected ones) keep their place,
+                # as subjects' posts are paired with their info by position
+                if list_for_subject_posts_text is None:
+                    list_for_subject_posts_text = []
+                self.subjects_posts_text.append(list_for_subject_posts_text)
+
+    def __twitter_get_and_filter_subject_posts(self, subject_id: str,
+                                               subject_screen_name: str) -> Optional[list]:
+        """
         Get subject's posts using his/her screen name, then run posts against the regex filters.
+
+        Args:
+            `subject_id`: the user ID of the subject.\n
+            `subject_screen_name`: the screen name of the subject.
+        Returns:
+            `list`: the cleaned texts of the posts or None if they are not available.
         """
-        for subject_screen_name in self._subject_screen_name:
-            try:
-                subject_posts = self._api.user_timeline(screen_name=subject_screen_name)
-            except TweepyException:
-                continue
-            list_for_subject_posts_text = []
-            for subject_post in subject_posts:
-                post_text = subject_post.text
-                # Replace links to tweets with empty strings using regex
-                cleaned_tweet = re.sub(r"http\S+", "", post_text)
-                list_for_subject_posts_text.append(cleaned_tweet)
-            self.subjects_posts_text.append(list_for_subject_posts_text)
+        cache_key = f"{subject_id}/{self.posts_count}"
+        if not self.bypass_cache:
+            cached_posts_text = POSTS_CACHE.get(cache_key)
+            if cached_posts_text is not None:
+                return cached_posts_text
+        try:
+            subject_posts = self._api.user_timeline(
+                screen_name=subject_screen_name,
+                count=max(self.posts_count, TIMELINE_PAGE_SIZE),
+                exclude_replies=True,
+                include_rts=False,
+            )
+        except TweepyException:
+            return None
+        list_for_subject_posts_text = []
+        for subject_post in subject_posts[:self.posts_count]:
+            post_text = subject_post.text
+            # Replace links to tweets with empty strings using regex
+            cleaned_tweet = re.sub(r"http\S+", "", post_text)
+            list_for_subject_posts_text.append(cleaned_tweet)
+        POSTS_CACHE.set(cache_key, list_for_subject_posts_text)
+        return list_for_subject_posts_text
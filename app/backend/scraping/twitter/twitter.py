@@ -1,20 +1,37 @@
 # -*- coding: utf-8 -*-
 """The main Twitter scraping module."""
 
-from app.backend.scraping.twitter._twitter_search import TwitterSearch
+from functools import partial
 
+from app.backend.analyzing.twitter._twitter_class import TwitterAnalyze
+from app.backend.scraping.twitter._twitter_search import POSTS_COUNT, TwitterSearch
 
-def caller_twitter(query: str) -> dict:
+
+def caller_twitter(query: str, bypass_cache: bool = False, posts_count: int = POSTS_COUNT,
+                   pushdown_user_input: dict = None) -> dict:
     """
     Call Twitter scraping methods and write information about found subjects to the dict.
 
     Args:
-        `query`: the query to run API calls against.
+        `query`: the query to run API calls against.\n
+        `bypass_cache`: fetch all subjects' posts from API instead of the cache.\n
+        `posts_count`: the number of the last posts to get of each subject \
+        (the report shows two).\n
+        `pushdown_user_input`: if given, the name filter of the analysis runs against \
+        this user input before posts are scraped, and only subjects passing it are kept \
+        (the analysis gives the same results with fewer requests).
     Returns:
         `dict`: the dictionary with information about subjects found on Twitter.
     """
     results_to_filter = {}
-    twitter_obj = TwitterSearch(query)
+    subject_filter = None
+    if pushdown_user_input is not None:
+        subject_filter = partial(
+            TwitterAnalyze.twitter_name_matches, user_input=pushdown_user_input
+        )
+    twitter_obj = TwitterSearch(
+        query, bypass_cache=bypass_cache, posts_count=posts_count, subject_filter=subject_filter
+    )
     twitter_obj.twitter_authorize()
     twitter_obj.twitter_search()
     found_subjects_info = twitter_obj.filtered_subjects_info
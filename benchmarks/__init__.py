@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""Micro-benchmarks for the project (run from the repository root)."""
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Compare how long the event loop is blocked when scraped pages are parsed \
+on the loop and in the parsing threads.
+
+Run from the repository root: ``python -m benchmarks.bench_parse_offloading``.
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from app.backend.scraping.scraper._scraper_engine import ScraperEngine, ScraperSettings
+from app.backend.scraping.scraper.scraping import scrape_many
+
+PAGE = "test/resources/github_profile_resource.html"
+PARAMS = "app/backend/scraping/google_search/google_params.json"
+PAGE_COPIES = 40
+CALENDAR_REPEATS = 60
+PORT = 8765
+
+
+def _write_heavy_page(directory: str) -> str:
+    """Write the recorded GitHub page with its contribution calendar repeated (a heavy page)."""
+    page = Path(PAGE).read_text()
+    start = page.index("          <svg")
+    end = page.index("</svg>", start) + len("</svg>")
+    heavy_page = page[:end] + page[start:end] * CALENDAR_REPEATS + page[end:]
+    Path(directory, "heavy.html").write_text(heavy_page)
+    return f"http://127.0.0.1:{PORT}/heavy.html"
+
+
+def _scrape(link: str, conf: dict, settings: ScraperSettings) -> tuple:
+    """Scrape the page `PAGE_COPIES` times concurrently and return wall and blocked times."""
+    engine = ScraperEngine(settings)
+    started = time.monotonic()
+    results = engine.run(scrape_many([(link, conf)] * PAGE_COPIES, engine))
+    elapsed = time.monotonic() - started
+    engine.run(engine.close())
+    assert not any("error" in result for result in results)
+    return elapsed, engine.loop_blocked_time
+
+
+def main():
+    """Serve the heavy page from a separate process and time both parsing modes."""
+    with open(PARAMS) as file:
+        (conf,) = json.load(file).values()
+    with tempfile.TemporaryDirectory() as directory:
+        link = _write_heavy_page(directory)
+        server = subprocess.Popen(
+            [sys.executable, "-m", "http.server", str(PORT), "--bind", "127.0.0.1"],
+            cwd=directory, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            time.sleep(1)
+            for streaming in (False, True):
+                for parse_workers in (0, 4):
+                    elapsed, blocked = _scrape(link, conf, ScraperSettings(
+                        streaming=streaming, parse_workers=parse_workers
+                    ))
+                    print(
+                        f"streaming={streaming!s:5} parse_workers={parse_workers}: "
+                        f"wall {elapsed:6.2f} s, loop blocked {blocked:6.2f} s"
+                    )
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Compare the ``fingerprint`` library with the NumPy winnowing engine \
+on the strings of the tests and on long biographies.
+
+Run from the repository root: ``python -m benchmarks.bench_similarity_ratio`` \
+(the ``fingerprint`` library is a development dependency).
+"""
+
+import json
+import timeit
+
+from fingerprint import Fingerprint
+from fingerprint.fingerprint import FingerprintException
+
+from app.backend.analyzing.substring_match.find_similarity_ratio import find_similarity_ratio
+
+RESOURCE = "test/resources/instagram_analyzing_resource.json"
+TEST_PAIRS = [
+    (
+        "Institute of Mathematics trains highly skilled mathematicians.",
+        "Institute of Mathematics is the only institution"
+        "that trains highly skilled mathematicians.",
+    ),
+    ("abc", "the string on the left arises an exception"),
+    ("hate being sober", "Long-term expat, CELTA/Delta qualified English teacher."),
+]
+LONG_BIOGRAPHY_LEN = 2000
+NUMBER = 200
+
+FINGERPRINT = Fingerprint(kgram_len=4, window_len=3, base=101, modulo=256)
+
+
+def _library_similarity_ratio(f_string: str, s_string: str) -> float:
+    """Find the similarity ratio as it was found with the ``fingerprint`` library."""
+    try:
+        f_hashes = [element[0] for element in FINGERPRINT.generate(str=f_string)]
+        s_hashes = [element[0] for element in FINGERPRINT.generate(str=s_string)]
+    except (FingerprintException, IndexError):
+        return 0
+    common_hashes = set(f_hashes).intersection(set(s_hashes))
+    return len(common_hashes) / len(min(f_hashes, s_hashes, key=len))
+
+
+def _long_biography_pairs() -> list:
+    """Make pairs of long biographies out of the biographies of the Instagram resource."""
+    with open(RESOURCE) as file:
+        biographies = [user["biography"] for user in json.load(file)["instagram"]]
+    long_biographies = []
+    for i in range(len(biographies)):
+        text = " ".join(biographies[i:] + biographies[:i])
+        long_biographies.append((text * (LONG_BIOGRAPHY_LEN // len(text) + 1))[:LONG_BIOGRAPHY_LEN])
+    return list(zip(long_biographies, long_biographies[1:]))
+
+
+def _time(pairs: list, similarity_ratio) -> float:
+    """Time the similarity ratio of all pairs in microseconds per pair."""
+    seconds = timeit.timeit(
+        lambda: [similarity_ratio(*pair) for pair in pairs], number=NUMBER
+    )
+    return seconds / NUMBER / len(pairs) * 1e6
+
+
+def main():
+    """Check that both give the same ratios, time them and print the results."""
+    pairs_by_name = {"test strings": TEST_PAIRS, "long biographies": _long_biography_pairs()}
+    for name, pairs in pairs_by_name.items():
+        for pair in pairs:
+            assert _library_similarity_ratio(*pair) == find_similarity_ratio(*pair)
+        library = _time(pairs, _library_similarity_ratio)
+        winnowing = _time(pairs, find_similarity_ratio)
+        print(f"{name}:")
+        print(f"  fingerprint library: {library:10.1f} us/pair")
+        print(f"  NumPy winnowing:     {winnowing:10.1f} us/pair")
+        print(f"  speed-up:            {library / winnowing:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
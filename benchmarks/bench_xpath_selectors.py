@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Compare raw-string XPATH evaluation with compiled selectors on the recorded GitHub page.
+
+Run from the repository root: ``python -m benchmarks.bench_xpath_selectors``.
+"""
+
+import json
+import timeit
+
+from lxml import html
+
+from app.backend.scraping.scraper._xpath_registry import compile_site_config
+
+PAGE = "test/resources/github_profile_resource.html"
+PARAMS = "app/backend/scraping/google_search/google_params.json"
+NUMBER = 2000
+
+
+def _raw_xpaths(conf: dict) -> list:
+    """Get raw XPATH strings of all fields (as the scraper evaluated them before)."""
+    raw_xpaths = []
+    for field, xpath_or_with_endpoint in conf.items():
+        if field == "service_name":
+            continue
+        if isinstance(xpath_or_with_endpoint, dict):
+            ((_, xpath_or_with_endpoint),) = xpath_or_with_endpoint.items()
+        raw_xpaths.append(xpath_or_with_endpoint)
+    return raw_xpaths
+
+
+def main():
+    """Time both paths and print the results per page."""
+    with open(PAGE) as file:
+        html_tree = html.fromstring(file.read())
+    with open(PARAMS) as file:
+        (conf,) = json.load(file).values()
+    raw_xpaths = _raw_xpaths(conf)
+    compiled_xpaths = [xpath for _, xpath, _ in compile_site_config(conf).fields]
+
+    raw = timeit.timeit(
+        lambda: [html_tree.xpath(xpath) for xpath in raw_xpaths], number=NUMBER
+    )
+    compiled = timeit.timeit(
+        lambda: [xpath(html_tree) for xpath in compiled_xpaths], number=NUMBER
+    )
+    print(f"raw strings:        {raw / NUMBER * 1e6:8.1f} us/page")
+    print(f"compiled selectors: {compiled / NUMBER * 1e6:8.1f} us/page")
+    print(f"speed-up:           {raw / compiled:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
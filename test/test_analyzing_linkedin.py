@@ -1,14 +1,17 @@
 # -*- coding: utf-8 -*-
 
+import copy
 import json
 import unittest
 from app.backend.analyzing.linkedin.linkedin import caller_analyze_linkedin
+from app.backend.scraping.helpers.profile_projection import project_profile
 
 
 class TestAnalyzingLinkedin(unittest.TestCase):
     def setUp(self):
         with open("test/resources/linkedin_analyzing_resource.json") as file:
-            scraping_response = json.load(file)
+            self.scraping_response = scraping_response = json.load(file)
+        self.scraping_response_before = copy.deepcopy(scraping_response)
         analyzing_response = caller_analyze_linkedin(scraping_response)
         dict_after_analysis = analyzing_response["linkedin"]
         (
@@ -57,6 +60,17 @@ class TestAnalyzingLinkedin(unittest.TestCase):
                 subject_education.pop("name", None)
                 self.assertFalse(subject_education)
 
+    def test_scraping_response_is_not_modified(self):
+        self.assertEqual(self.scraping_response, self.scraping_response_before)
+
+    def test_projection_is_idempotent(self):
+        for subject in self.list_of_subjects:
+            self.assertEqual(project_profile(subject), subject)
+        raw_subject = dict(
+            self.scraping_response["linkedin"]["found_subjects"][0], publicIdentifier="octocat"
+        )
+        self.assertNotIn("publicIdentifier", project_profile(raw_subject))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,16 @@
 # -*- coding: utf-8 -*-
 
 import unittest
+from unittest import mock
+
+import numpy as np
+
+from app.backend.analyzing.substring_match._winnowing import Winnowing
 from app.backend.analyzing.substring_match.find_similarity_ratio import (
+    SimilarityIndex,
     find_similarity_ratio,
+    find_similarity_ratios,
+    most_similar,
 )
 
 
@@ -27,6 +35,75 @@ class TestAnalyzingSimilarityRatio(unittest.TestCase):
         )
         self.assertEqual(similarity_in_exception, 0)
 
+    def test_fingerprints_of_the_fingerprint_library_are_reproduced(self):
+        # Recorded with fingerprint.Fingerprint(kgram_len=4, window_len=3, base=101, modulo=256)
+        fingerprint = Winnowing().fingerprint("CELTA English teacher")
+        self.assertEqual(fingerprint.hashes.tolist(), [4, 6, 26, 30, 34, 53, 132])
+        self.assertEqual(fingerprint.size, 7)
+        fingerprint = Winnowing().fingerprint("Київ, Україна \U0001f1fa\U0001f1e6 travel")
+        self.assertEqual(fingerprint.hashes.tolist(), [25, 34, 68, 117, 132, 185, 188])
+        similarity = find_similarity_ratio(
+            "Long-term expat, CELTA/Delta qualified English teacher, freelance writer.",
+            "CELTA English teacher",
+        )
+        self.assertEqual(similarity, 1 / 7)
+
+    def test_hash_width_is_selectable(self):
+        winnowing = Winnowing(hash_bits=32)
+        fingerprint = winnowing.fingerprint("Institute of Mathematics")
+        self.assertEqual(fingerprint.hashes.dtype, np.uint32)
+        self.assertGreater(fingerprint.hashes.max(), 255)
+        similarity = find_similarity_ratio(
+            "Institute of Mathematics", "Institute of Mathematics", winnowing
+        )
+        self.assertEqual(similarity, 1)
+        with self.assertRaises(ValueError):
+            Winnowing(hash_bits=12)
+
+    def test_similarity_index_fingerprints_the_query_once(self):
+        winnowing = Winnowing()
+        query = "CELTA English teacher"
+        candidates = [
+            "Long-term expat, CELTA/Delta qualified English teacher, freelance writer.",
+            "CELTA English teacher",
+            "abc",
+            "Long-term expat, CELTA/Delta qualified English teacher, freelance writer.",
+        ]
+        fingerprint = mock.Mock(wraps=winnowing.fingerprint)
+        with mock.patch.object(winnowing, "fingerprint", fingerprint):
+            similarity_index = SimilarityIndex(query, winnowing, max_candidates=3)
+            similarities = [similarity_index.score(candidate) for candidate in candidates]
+        self.assertEqual(
+            similarities, [find_similarity_ratio(query, candidate) for candidate in candidates]
+        )
+        # The query and three distinct candidates, the repeated candidate is cached
+        self.assertEqual(fingerprint.call_count, 4)
+        self.assertEqual(SimilarityIndex("a.%^^*-").score(query), 0)
+
+    def test_batch_similarities_are_the_pairwise_ones(self):
+        query = "Institute of Mathematics trains highly skilled mathematicians."
+        candidates = [
+            "Institute of Mathematics is the only institution"
+            "that trains highly skilled mathematicians.",
+            "abc",
+            "CELTA English teacher",
+            "Institute of Mathematics",
+            "a.%^^*-",
+        ]
+        similarities = find_similarity_ratios(query, candidates)
+        self.assertEqual(
+            similarities.tolist(),
+            [find_similarity_ratio(query, candidate) for candidate in candidates],
+        )
+        self.assertEqual(find_similarity_ratios("abc", candidates).tolist(), [0] * 5)
+        self.assertEqual(find_similarity_ratios(query, []).tolist(), [])
+
+    def test_most_similar_candidates_are_ordered_by_similarity(self):
+        similarities = np.array([0.5, 0.9, 0.6, 1.0, 0.9])
+        self.assertEqual(most_similar(similarities, 3).tolist(), [3, 1, 4])
+        self.assertEqual(most_similar(similarities, 10).tolist(), [3, 1, 4, 2])
+        self.assertEqual(most_similar(similarities, 10, threshold=0).tolist(), [3, 1, 4, 2, 0])
+
 
 if __name__ == "__main__":
     unittest.main()
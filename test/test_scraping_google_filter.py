@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+import re
+import unittest
+from app.backend.scraping.google_search._google_dispatch_index import LinkDispatchIndex
+from app.backend.scraping.google_search._google_filter import filtering
+from app.backend.scraping.scraper._xpath_registry import SiteSelectors
+
+
+class TestScrapingGoogleFilter(unittest.TestCase):
+    items = [
+        {
+            "kind": "customsearch#result",
+            "title": "octocat (The Octocat) · GitHub",
+            "link": "https://github.com/octocat",
+            "snippet": "The Octocat has 8 repositories available.",
+        },
+        {
+            "kind": "customsearch#result",
+            "title": "The Octocat",
+            "link": "https://example.com/octocat",
+            "snippet": "Not a profile from the params file.",
+        },
+    ]
+
+    def test_only_matching_links_with_compiled_selectors(self):
+        filtered_items = filtering(TestScrapingGoogleFilter.items)
+        self.assertEqual(len(filtered_items), 1)
+        link, selectors = filtered_items[0]
+        self.assertEqual(link, "https://github.com/octocat")
+        self.assertIsInstance(selectors, SiteSelectors)
+        self.assertEqual(selectors.service_name, "GitHub Profile")
+
+    def test_selectors_are_compiled_once(self):
+        (_, first_selectors), = filtering(TestScrapingGoogleFilter.items)
+        (_, second_selectors), = filtering(TestScrapingGoogleFilter.items)
+        self.assertIs(first_selectors, second_selectors)
+
+    def test_dispatch_index_matches_like_fullmatch_of_each_regex(self):
+        configs_by_regex = {
+            r"https:\/\/github.com\/[a-zA-Z0-9`~!@#$^*()_+-.,|<>№]+": "GitHub profile",
+            r"https://github\.com/[a-z]+/[a-z-]+": "GitHub repository",
+            r"https?://(www\.)?gitlab\.com/.+": "GitLab",
+            r"https://[a-z]+\.github\.io/.*": "GitHub Pages",
+            r"https://twitter.com/[A-Za-z0-9_]+": "Twitter",
+            r"https://github\.com/[a-z]+|https://gitlab\.com/[a-z]+": "GitHub or GitLab",
+            r"https://foo\.io/(a)(b)/\1\2": "Repeated path",
+            r"https://foo\.io/(?P<part>[a-z]+)/(?P=part)": "Repeated named path",
+            r"(?i)https://twitter\.com/[a-z]+": "Twitter in any case",
+            r"https://github\.com:.+": "GitHub with a port",
+            r"https://foo\.io/(a)(?(1)b|c)/x": "Conditional path",
+        }
+        links = [
+            "https://github.com/octocat",
+            "https://github.com/octocat/hello-world",
+            "https://GITHUB.com/octocat",
+            "http://github.com/octocat",
+            "https://www.gitlab.com/octocat",
+            "https://octocat.github.io/",
+            "https://twitter.com/octocat",
+            "https://TWITTER.com/Octocat",
+            "https://gitlab.com/octocat",
+            "https://foo.io/ab/ab",
+            "https://foo.io/ab/ba",
+            "https://foo.io/ab/x",
+            "https://githubxcom/octocat",
+            "https://github.com:1@gitlab.com/octocat",
+            "https://example.com/octocat",
+            "not a link",
+        ]
+        dispatch_index = LinkDispatchIndex(configs_by_regex)
+        for link in links:
+            expected_configs = [
+                config
+                for regex, config in configs_by_regex.items()
+                if re.fullmatch(regex, link)
+            ]
+            self.assertEqual(dispatch_index.match(link), expected_configs, link)
+
+
+if __name__ == "__main__":
+    unittest.main()
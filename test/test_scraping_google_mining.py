@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from googleapiclient.http import HttpMock
+
+from app.backend.scraping.google_search._google_country_code import (
+    COUNTRY_CODE_ENV,
+    CountryCodeProvider,
+)
+from app.backend.scraping.google_search._google_mining import (
+    _custom_search,
+    _custom_search_service,
+    mining,
+)
+from app.backend.scraping.helpers.persistent_cache import CACHE_DIRECTORY_ENV, PersistentCache
+
+
+class _IpstackStub:
+    def __init__(self, country_code="UA"):
+        self.country_code = country_code
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.country_code
+
+
+class TestScrapingGoogleMining(unittest.TestCase):
+    def setUp(self):
+        self.ipstack = _IpstackStub()
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.directory.name, "country_code.json")
+        environment = mock.patch.dict(os.environ)
+        environment.start()
+        self.addCleanup(environment.stop)
+        os.environ.pop(COUNTRY_CODE_ENV, None)
+        os.environ[CACHE_DIRECTORY_ENV] = self.directory.name
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_country_code_is_looked_up_once(self):
+        provider = CountryCodeProvider(self.ipstack)
+        searched = []
+
+        def custom_search_stub(query, country_code, start=1):
+            searched.append((query, country_code))
+            return [{"link": "https://github.com/octocat"}]
+
+        for query in ("The Octocat", "github octocat"):
+            found_items = mining(query, provider, custom_search_stub)
+        self.assertEqual(found_items, [{"link": "https://github.com/octocat"}])
+        self.assertEqual(searched, [("The Octocat", "ua"), ("github octocat", "ua")])
+        self.assertEqual(self.ipstack.calls, 1)
+
+    def test_on_disk_cache_is_reused_until_expired(self):
+        CountryCodeProvider(self.ipstack, cache_file=self.cache_file).get_country_code()
+        country_code = CountryCodeProvider(
+            _IpstackStub("PL"), cache_file=self.cache_file
+        ).get_country_code()
+        self.assertEqual(country_code, "ua")
+
+        with open(self.cache_file) as file:
+            cached = json.load(file)
+        cached["fetched_at"] = time.time() - 120
+        with open(self.cache_file, "w") as file:
+            json.dump(cached, file)
+        country_code = CountryCodeProvider(
+            _IpstackStub("PL"), cache_file=self.cache_file, cache_ttl=60
+        ).get_country_code()
+        self.assertEqual(country_code, "pl")
+
+    def test_override(self):
+        provider = CountryCodeProvider(self.ipstack, override="DE")
+        self.assertEqual(provider.get_country_code(), "de")
+        os.environ[COUNTRY_CODE_ENV] = "FR"
+        self.assertEqual(CountryCodeProvider(self.ipstack).get_country_code(), "fr")
+        self.assertEqual(self.ipstack.calls, 0)
+
+    def test_search_results_are_cached_by_query_and_country(self):
+        result_cache = PersistentCache("search", ttl=60, max_entries=10)
+        searched = []
+
+        def custom_search_stub(query, country_code, start=1):
+            searched.append((query, country_code))
+            return [{"link": "https://github.com/octocat"}]
+
+        for query, country_code in (("The Octocat", "UA"), ("The Octocat", "UA"),
+                                    ("The Octocat", "PL")):
+            provider = CountryCodeProvider(override=country_code)
+            found_items = mining(query, provider, custom_search_stub, result_cache)
+            self.assertEqual(found_items, [{"link": "https://github.com/octocat"}])
+        self.assertEqual(searched, [("The Octocat", "ua"), ("The Octocat", "pl")])
+        self.assertEqual(result_cache.stats(), {"hits": 1, "misses": 2, "entries": 2})
+
+        repeated_run_cache = PersistentCache("search", ttl=60, max_entries=10)
+        mining("The Octocat", CountryCodeProvider(override="UA"), custom_search_stub,
+               repeated_run_cache)
+        self.assertEqual(len(searched), 2)
+        self.assertEqual(repeated_run_cache.hits, 1)
+
+    def test_pages_are_searched_from_their_first_result(self):
+        provider = CountryCodeProvider(override="UA")
+        result_cache = PersistentCache("search", ttl=60, max_entries=10)
+        searched = []
+
+        def custom_search_stub(query, country_code, start=1):
+            searched.append(start)
+            return [{"link": f"https://github.com/octocat?start={start}"}]
+
+        for page in (1, 3, 3):
+            found_items = mining("The Octocat", provider, custom_search_stub, result_cache, page)
+        self.assertEqual(found_items, [{"link": "https://github.com/octocat?start=21"}])
+        self.assertEqual(searched, [1, 21])
+        with self.assertRaises(ValueError):
+            mining("The Octocat", provider, custom_search_stub, result_cache, page=11)
+
+    def test_result_cache_expiry_and_eviction(self):
+        result_cache = PersistentCache("search", ttl=60, max_entries=2)
+        result_cache.set("expired", [], ttl=-1)
+        self.assertIsNone(result_cache.get("expired"))
+        for key in ("first", "second"):
+            result_cache.set(key, [key])
+        self.assertEqual(result_cache.get("first"), ["first"])
+        result_cache.set("third", ["third"])
+        self.assertIsNone(result_cache.get("second"))
+        self.assertEqual(result_cache.get("first"), ["first"])
+        self.assertEqual(result_cache.stats()["entries"], 2)
+
+    def test_custom_search_service_is_built_once_offline(self):
+        os.environ["GOOGLE_DEVELOPER_KEY"] = "key"
+        _custom_search_service.cache_clear()
+        with mock.patch("httplib2.Http.request", side_effect=AssertionError("no network")):
+            service = _custom_search_service()
+        self.assertIs(service, _custom_search_service())
+        _custom_search_service.cache_clear()
+
+    def test_custom_search_uses_thread_http(self):
+        os.environ["GOOGLE_DEVELOPER_KEY"] = "key"
+        os.environ["GOOGLE_CSE_ID"] = "cse"
+        response_file = os.path.join(self.directory.name, "answer.json")
+        with open(response_file, "w") as file:
+            json.dump({"items": [{"link": "https://github.com/octocat"}]}, file)
+        http = HttpMock(response_file, {"status": "200"})
+        with mock.patch(
+            "app.backend.scraping.google_search._google_mining._thread_http", return_value=http
+        ):
+            found_items = _custom_search("The Octocat", "ua", start=11)
+        self.assertEqual(found_items, [{"link": "https://github.com/octocat"}])
+        self.assertIn("gl=ua", http.uri)
+        self.assertIn("start=11", http.uri)
+        self.assertIn("q=The+Octocat", http.uri)
+        _custom_search_service.cache_clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
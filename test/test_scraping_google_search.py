@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+import time
+import unittest
+from unittest import mock
+
+from app.backend.scraping.google_search.google_search import caller_google_search
+
+
+def _fake_mining(query, page=1):
+    if page > 1:
+        return [
+            {"title": query, "link": "https://github.com/octocat", "snippet": ""},
+            {"title": query, "link": f"https://github.com/octocat-{page}", "snippet": ""},
+        ]
+    return [
+        {"title": query, "link": "https://github.com/octocat", "snippet": ""},
+        {"title": query, "link": f"https://github.com/{query.split()[0]}", "snippet": ""},
+    ]
+
+
+async def _fake_scrape_many(links_and_configs):
+    return [
+        {"service_name": config.service_name, "link": link, "Nickname: ": link[19:]}
+        for link, config in links_and_configs
+    ]
+
+
+class TestScrapingGoogleSearch(unittest.TestCase):
+    user_input = {
+        "first_name": "The",
+        "last_name": "Octocat",
+        "company": "",
+        "job_title": "",
+        "school": "",
+        "twitter_profile": "",
+        "instagram_nickname": "",
+        "location": "San Francisco",
+        "additional_text": "",
+        "github": "octocat",
+    }
+
+    def setUp(self):
+        with mock.patch(
+            "app.backend.scraping.google_search.google_search.mining", _fake_mining
+        ), mock.patch(
+            "app.backend.scraping.google_search.google_search.scrape_many",
+            side_effect=_fake_scrape_many,
+        ) as self.scrape_many:
+            self.response = caller_google_search(TestScrapingGoogleSearch.user_input)
+
+    def test_each_unique_link_is_scraped_once(self):
+        links = [
+            link
+            for (links_and_configs,), _ in self.scrape_many.call_args_list
+            for link, _ in links_and_configs
+        ]
+        self.assertCountEqual(
+            links, ["https://github.com/octocat", "https://github.com/github", "https://github.com/The"]
+        )
+
+    def test_results_are_fanned_out_to_selectors(self):
+        scraped_webpages = self.response["google_search"]
+        self.assertEqual(list(scraped_webpages), ["github", "name"])
+        for selector in ("github", "name"):
+            self.assertEqual(len(scraped_webpages[selector]), 2)
+            self.assertEqual(scraped_webpages[selector][0]["Nickname: "], "octocat")
+        self.assertIsNot(scraped_webpages["github"][0], scraped_webpages["name"][0])
+
+    def test_selectors_are_searched_concurrently(self):
+        def slow_mining(query, page=1):
+            time.sleep(0.3)
+            return _fake_mining(query, page)
+
+        user_input = dict(TestScrapingGoogleSearch.user_input, twitter="octocat", blog="octo")
+        started = time.monotonic()
+        with mock.patch(
+            "app.backend.scraping.google_search.google_search.mining", slow_mining
+        ), mock.patch(
+            "app.backend.scraping.google_search.google_search.scrape_many", _fake_scrape_many
+        ):
+            response = caller_google_search(user_input)
+        self.assertLess(time.monotonic() - started, 0.6)
+        self.assertEqual(list(response["google_search"]), ["github", "twitter", "blog", "name"])
+
+    def test_result_pages_are_searched_concurrently(self):
+        searched_pages = []
+
+        def slow_mining(query, page=1):
+            searched_pages.append((query, page))
+            time.sleep(0.3)
+            return _fake_mining(query, page)
+
+        started = time.monotonic()
+        with mock.patch(
+            "app.backend.scraping.google_search.google_search.mining", slow_mining
+        ), mock.patch(
+            "app.backend.scraping.google_search.google_search.scrape_many", _fake_scrape_many
+        ):
+            response = caller_google_search(TestScrapingGoogleSearch.user_input, 2)
+        self.assertLess(time.monotonic() - started, 0.6)
+        self.assertCountEqual(searched_pages, [
+            ("github octocat", 1), ("github octocat", 2), ("The Octocat", 1), ("The Octocat", 2)
+        ])
+        nicknames = [webpage["Nickname: "] for webpage in response["google_search"]["name"]]
+        self.assertEqual(nicknames, ["octocat", "The", "octocat-2"])
+
+    def test_page_budget_is_checked(self):
+        for pages_per_query in (0, 11):
+            with self.assertRaises(ValueError):
+                caller_google_search(TestScrapingGoogleSearch.user_input, pages_per_query)
+
+
+if __name__ == "__main__":
+    unittest.main()
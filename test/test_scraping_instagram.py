@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from app.backend.analyzing.instagram.instagram import caller_analyze_instagram
+from app.backend.scraping.helpers.persistent_cache import CACHE_DIRECTORY_ENV
+from app.backend.scraping.helpers.rate_limiter import RateLimiter
+from app.backend.scraping.instagram._instagram_class import Instagram
+from app.backend.scraping.instagram.instagram import caller_instagram
+
+
+class _InstagramApiStub:
+    users = [
+        {"pk": 1, "username": "octocat", "full_name": "The Octocat"},
+        {"pk": 2, "username": "monalisa", "full_name": "Mona Lisa Octocat"},
+    ]
+
+    def __init__(self, users=None, delay=0.0):
+        if users is not None:
+            self.users = users
+        self.delay = delay
+        self.user_infos = []
+        self.lock = threading.Lock()
+        self.running = self.max_running = 0
+
+    def search_users(self, query):
+        return {"users": self.search_hits()}
+
+    def search_hits(self):
+        return [
+            {"pk": user["pk"], "username": user["username"], "full_name": user["full_name"]}
+            for user in self.users
+        ]
+
+    def user_info(self, user_id):
+        with self.lock:
+            self.user_infos.append(user_id)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+        (user,) = [user for user in self.users if user["pk"] == user_id]
+        return {"user": dict({"follower_count": user_id * 10, "is_private": False}, **user)}
+
+
+class TestScrapingInstagram(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        patches = (
+            mock.patch.dict(os.environ, {CACHE_DIRECTORY_ENV: directory.name}),
+            mock.patch.object(
+                Instagram, "SETTINGS_FILE", os.path.join(directory.name, "cookie_settings.json")
+            ),
+        )
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def __instagram(self, bypass_cache=False, api=None, **kwargs):
+        api = api or _InstagramApiStub()
+        with mock.patch(
+            "app.backend.scraping.instagram._instagram_class.Client", return_value=api
+        ):
+            kwargs.setdefault("requests_per_second", 1000)
+            instagram_object = Instagram("octocat", bypass_cache=bypass_cache, **kwargs)
+            instagram_object.instagram()
+        return api.user_infos, instagram_object.filtered_info_about_subjects
+
+    def test_users_info_is_filtered_and_cached_by_id(self):
+        fetched, filtered_info = self.__instagram()
+        self.assertCountEqual(fetched, [1, 2])
+        expected_info = [
+            {"username": "octocat", "full_name": "The Octocat", "follower_count": 10},
+            {"username": "monalisa", "full_name": "Mona Lisa Octocat", "follower_count": 20},
+        ]
+        self.assertEqual(filtered_info, expected_info)
+        fetched, filtered_info = self.__instagram()
+        self.assertEqual(fetched, [])
+        self.assertEqual(filtered_info, expected_info)
+        fetched, _ = self.__instagram(bypass_cache=True)
+        self.assertCountEqual(fetched, [1, 2])
+
+    def test_users_info_is_fetched_concurrently_in_order(self):
+        users = [
+            {"pk": pk, "username": f"octocat{pk}", "full_name": "The Octocat"}
+            for pk in range(1, 7)
+        ]
+        api = _InstagramApiStub(users, delay=0.2)
+        started = time.monotonic()
+        _, filtered_info = self.__instagram(api=api, max_workers=3, requests_per_second=1000)
+        self.assertLess(time.monotonic() - started, 0.6)
+        self.assertEqual(api.max_running, 3)
+        self.assertEqual(
+            [info["username"] for info in filtered_info],
+            [f"octocat{pk}" for pk in range(1, 7)],
+        )
+
+    def test_nick_or_name_filter_pushdown_gives_the_same_analysis(self):
+        with open("test/resources/instagram_analyzing_resource.json") as file:
+            users = json.load(file)["instagram"]
+        for pk, user in enumerate(users, 1):
+            user["pk"] = pk
+        user_input = {
+            "first_name": "Denis",
+            "last_name": "Voitsekovsky",
+            "instagram_nickname": "",
+            "additional_text": "hate being sober",
+        }
+        for instagram_nickname, expected_fetched in (("", [1]), ("fuck.off.idc", [4])):
+            user_input["instagram_nickname"] = instagram_nickname
+            analyses = []
+            for pushdown_user_input in (None, user_input):
+                api = _InstagramApiStub(users)
+                with mock.patch(
+                    "app.backend.scraping.instagram._instagram_class.Client", return_value=api
+                ), mock.patch.object(RateLimiter, "wait"):
+                    scraping_response = caller_instagram(
+                        "idc", bypass_cache=True, pushdown_user_input=pushdown_user_input
+                    )
+                analyses.append(caller_analyze_instagram(scraping_response, user_input))
+            self.assertEqual(api.user_infos, expected_fetched)
+            self.assertEqual(analyses[0], analyses[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
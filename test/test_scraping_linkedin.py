@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+
+import os
+import stat
+import tempfile
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from linkedin_api import Linkedin as LinkedinAPI
+from requests.cookies import RequestsCookieJar, create_cookie
+
+from app.backend.scraping.helpers.persistent_cache import CACHE_DIRECTORY_ENV
+from app.backend.scraping.helpers.rate_limiter import RateLimiter
+from app.backend.scraping.linkedin._linkedin_search import LinkedinSearch
+from app.backend.scraping.linkedin._linkedin_search_info import LinkedinSearchSubjects
+
+
+class _LinkedinApiStub:
+    search_results = {
+        "keyword_company": ["octocat", "monalisa", "hubot"],
+        "keyword_school": ["monalisa", "octocat"],
+        "keyword_title": ["octocat", "hubot"],
+    }
+
+    def __init__(self, delay=0.0, session_status=200):
+        self.delay = delay
+        self.session_status = session_status
+        self.session_checks = 0
+        self.lock = threading.Lock()
+        self.running = self.max_running = 0
+        self.searches = []
+        self.profiles = []
+        self.client = SimpleNamespace(
+            cookies=_session_cookies(time.time() + 60),
+            authenticate=lambda username, password: None,
+            session=SimpleNamespace(get=self.__get),
+            API_BASE_URL="https://www.linkedin.com/voyager/api",
+        )
+
+    def __get(self, url):
+        self.session_checks += 1
+        return SimpleNamespace(status_code=self.session_status)
+
+    def search_people(self, keyword_first_name, keyword_last_name, keyword_company=None,
+                      keyword_school=None, keyword_title=None):
+        keywords = {
+            "keyword_company": keyword_company,
+            "keyword_school": keyword_school,
+            "keyword_title": keyword_title,
+        }
+        keyword_names = [name for name, keyword in keywords.items() if keyword]
+        if len(keyword_names) > 1:
+            # No subject matches the company, the school and the title at once
+            return []
+        (keyword_name,) = keyword_names
+        self.searches.append(keyword_name)
+        time.sleep(self.delay)
+        return [{"public_id": public_id} for public_id in self.search_results[keyword_name]]
+
+    def get_profile(self, public_id):
+        with self.lock:
+            self.profiles.append(public_id)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+        return {
+            "firstName": public_id,
+            "lastName": "Octocat",
+            "publicIdentifier": public_id,
+            "skills": [{"name": "Git", "standardizedSkillUrn": "urn:li:skill:1"}],
+        }
+
+
+def _session_cookies(expires):
+    cookies = RequestsCookieJar()
+    cookies.set_cookie(create_cookie(
+        "JSESSIONID", '"ajax:1"', domain=".www.linkedin.com", expires=int(expires)
+    ))
+    cookies.set_cookie(create_cookie("li_at", "token", domain=".linkedin.com", secure=True))
+    return cookies
+
+
+class TestScrapingLinkedin(unittest.TestCase):
+    user_input = {
+        "first_name": "The",
+        "last_name": "Octocat",
+        "company": "GitHub",
+        "school": "",
+        "job_title": "",
+    }
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cookies_file = os.path.join(directory.name, "cookies.json")
+        cookies_file = mock.patch.object(LinkedinSearch, "COOKIES_FILE", self.cookies_file)
+        cookies_file.start()
+        self.addCleanup(cookies_file.stop)
+        environment = mock.patch.dict(os.environ, {
+            "LINKEDIN_LOGIN": "octocat@github.com", CACHE_DIRECTORY_ENV: directory.name
+        })
+        environment.start()
+        self.addCleanup(environment.stop)
+
+    def __search(self, user_input, api):
+        subjects = LinkedinSearchSubjects(user_input)
+        with mock.patch(
+            "app.backend.scraping.linkedin._linkedin_search.LinkedinAPI", return_value=api
+        ) as self.linkedin_api:
+            subjects.linkedin_search()
+        subjects.linkedin_find_ids()
+        return subjects
+
+    def test_session_cookies_are_saved_and_reused(self):
+        api = _LinkedinApiStub()
+        self.__search(TestScrapingLinkedin.user_input, api)
+        self.assertTrue(self.linkedin_api.call_args[1]["refresh_cookies"])
+        self.assertEqual(stat.S_IMODE(os.stat(self.cookies_file).st_mode), 0o600)
+
+        self.__search(TestScrapingLinkedin.user_input, _LinkedinApiStub())
+        cookies = self.linkedin_api.call_args[1]["cookies"]
+        self.assertEqual(
+            {cookie.name: cookie.value for cookie in cookies},
+            {"JSESSIONID": '"ajax:1"', "li_at": "token"},
+        )
+        self.assertTrue(next(cookie for cookie in cookies if cookie.name == "li_at").secure)
+
+    def test_revoked_session_is_reauthenticated(self):
+        self.__search(TestScrapingLinkedin.user_input, _LinkedinApiStub())
+        api = _LinkedinApiStub(session_status=401)
+        api.client.cookies = _session_cookies(time.time() + 120)
+        self.__search(TestScrapingLinkedin.user_input, api)
+        self.assertEqual(api.session_checks, 1)
+        saved_cookies_call, password_call = self.linkedin_api.call_args_list
+        self.assertIn("cookies", saved_cookies_call[1])
+        self.assertTrue(password_call[1]["refresh_cookies"])
+        self.assertEqual(api.searches, ["keyword_company"])
+        # The new session cookies replace the revoked ones
+        self.__search(TestScrapingLinkedin.user_input, _LinkedinApiStub())
+        cookies = self.linkedin_api.call_args[1]["cookies"]
+        self.assertEqual(
+            {cookie.name: cookie.expires for cookie in cookies}["JSESSIONID"],
+            next(cookie.expires for cookie in api.client.cookies if cookie.name == "JSESSIONID"),
+        )
+
+    def test_only_the_protected_cookies_file_is_written(self):
+        library_cookies_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(library_cookies_directory.cleanup)
+        session_cookies = mock.Mock(cookies=_session_cookies(time.time() + 60))
+        authentication = mock.Mock(status_code=200, cookies=_session_cookies(time.time() + 60))
+        authentication.json.return_value = {"login_result": "PASS"}
+        with mock.patch(
+                "linkedin_api.settings.COOKIE_PATH", library_cookies_directory.name + os.sep
+        ), mock.patch("linkedin_api.client.requests.get", return_value=session_cookies), \
+                mock.patch("linkedin_api.client.requests.post", return_value=authentication), \
+                mock.patch("linkedin_api.client.Client._fetch_metadata"), \
+                mock.patch.object(LinkedinAPI, "search_people", return_value=[]):
+            LinkedinSearch(TestScrapingLinkedin.user_input).linkedin_search()
+        self.assertEqual(os.listdir(library_cookies_directory.name), [])
+        self.assertEqual(stat.S_IMODE(os.stat(self.cookies_file).st_mode), 0o600)
+
+    def test_expired_or_foreign_session_is_reauthenticated(self):
+        api = _LinkedinApiStub()
+        api.client.cookies = _session_cookies(time.time() - 60)
+        self.__search(TestScrapingLinkedin.user_input, api)
+        self.__search(TestScrapingLinkedin.user_input, _LinkedinApiStub())
+        self.assertNotIn("cookies", self.linkedin_api.call_args[1])
+
+        os.environ["LINKEDIN_LOGIN"] = "monalisa@github.com"
+        self.__search(TestScrapingLinkedin.user_input, _LinkedinApiStub())
+        self.assertNotIn("cookies", self.linkedin_api.call_args[1])
+
+    def test_candidate_searches_run_concurrently(self):
+        api = _LinkedinApiStub(delay=0.3)
+        user_input = dict(TestScrapingLinkedin.user_input, school="MIT", job_title="Mascot")
+        started = time.monotonic()
+        subjects = self.__search(user_input, api)
+        self.assertLess(time.monotonic() - started, 0.6)
+        self.assertCountEqual(api.searches, ["keyword_company", "keyword_school", "keyword_title"])
+        self.assertEqual(subjects._found_subjects_public_ids, ["octocat"])
+        # The results are counted in the company, school, title order whatever finishes first
+        self.assertEqual(subjects._potential_subjects_ids_after_filtering, [])
+
+    def test_missing_keywords_are_not_searched(self):
+        api = _LinkedinApiStub()
+        subjects = self.__search(TestScrapingLinkedin.user_input, api)
+        self.assertEqual(api.searches, ["keyword_company"])
+        self.assertEqual(
+            [subject["public_id"] for subject in subjects._potential_subjects],
+            ["octocat", "monalisa", "hubot"],
+        )
+
+    def test_profiles_are_fetched_concurrently_in_order(self):
+        subjects = LinkedinSearchSubjects(
+            TestScrapingLinkedin.user_input, max_workers=3, requests_per_second=1000
+        )
+        subjects._api = _LinkedinApiStub(delay=0.2)
+        subjects._potential_subjects_ids_after_filtering = ["a", "b", "c", "d", "e", "f"]
+        started = time.monotonic()
+        subjects.linkedin_search_for_info()
+        self.assertLess(time.monotonic() - started, 0.6)
+        self.assertEqual(subjects._api.max_running, 3)
+        self.assertEqual(
+            [info["firstName"] for info in subjects.potential_subjects_info_after_filtering],
+            ["a", "b", "c", "d", "e", "f"],
+        )
+        self.assertEqual(
+            subjects.potential_subjects_info_after_filtering[0],
+            {"firstName": "a", "lastName": "Octocat", "skills": [{"name": "Git"}]},
+        )
+        self.assertEqual(subjects.found_subjects_info, [])
+
+    def test_profiles_are_cached_by_public_id(self):
+        def fetch_profiles(public_ids, bypass_cache=False):
+            subjects = LinkedinSearchSubjects(
+                TestScrapingLinkedin.user_input, bypass_cache=bypass_cache
+            )
+            subjects._api = _LinkedinApiStub()
+            subjects._found_subjects_public_ids = public_ids
+            subjects.linkedin_search_for_info()
+            return subjects._api.profiles, subjects.found_subjects_info
+
+        fetched, _ = fetch_profiles(["octocat", "monalisa"])
+        self.assertEqual(fetched, ["octocat", "monalisa"])
+        fetched, profiles = fetch_profiles(["monalisa", "hubot", "octocat"])
+        self.assertEqual(fetched, ["hubot"])
+        self.assertEqual(
+            profiles, [{"firstName": public_id, "lastName": "Octocat", "skills": [{"name": "Git"}]}
+                       for public_id in ("monalisa", "hubot", "octocat")]
+        )
+        fetched, _ = fetch_profiles(["octocat"], bypass_cache=True)
+        self.assertEqual(fetched, ["octocat"])
+
+    def test_rate_limiter_spaces_out_requests(self):
+        rate_limiter = RateLimiter(requests_per_second=20)
+        started = time.monotonic()
+        threads = [threading.Thread(target=rate_limiter.wait) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertGreaterEqual(time.monotonic() - started, 0.19)
+
+
+if __name__ == "__main__":
+    unittest.main()
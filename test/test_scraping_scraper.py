@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from unittest import mock
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from app.backend.scraping.scraper._scraper_engine import (
+    ScraperEngine,
+    ScraperSettings,
+    get_scraper_engine,
+)
+from app.backend.scraping.scraper._xpath_registry import compile_site_config
+from app.backend.scraping.scraper import scraping as scraping_module
+from app.backend.scraping.scraper._html_streaming import _IncrementalHtmlParser
+from app.backend.scraping.scraper.scraping import is_error_record, scrape_many, scraping
+
+
+class _ResourceHandler(SimpleHTTPRequestHandler):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory="test/resources", **kwargs)
+
+    def do_GET(self):
+        if self.path == "/slow":
+            time.sleep(1)
+        if self.path.startswith("/cyrillic"):
+            self.__send_cyrillic_page()
+            return
+        super().do_GET()
+
+    def __send_cyrillic_page(self):
+        # The GitHub page with a non-ASCII name, without <meta charset> and with the charset
+        # of the Content-Type header from the query (no charset if there is no query)
+        with open("test/resources/github_profile_resource.html", "rb") as file:
+            body = file.read().replace(b'<meta charset="utf-8">', b"")
+        body = body.replace(b"The Octocat", "Октокіт Łódź".encode("utf-8"))
+        _, _, charset = self.path.partition("?")
+        self.send_response(200)
+        content_type = f"text/html; charset={charset}" if charset else "text/html"
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _QuietServer(ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        pass
+
+
+class TestScrapingScraper(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = _QuietServer(("127.0.0.1", 0), _ResourceHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.link = (
+            f"http://127.0.0.1:{cls.server.server_port}/github_profile_resource.html"
+        )
+        with open("app/backend/scraping/google_search/google_params.json") as file:
+            (cls.config,) = json.load(file).values()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_scraped_fields(self):
+        (result,) = scraping([(self.link, self.config)])
+        self.assertEqual(result["service_name"], "GitHub Profile")
+        self.assertEqual(result["link"], self.link)
+        self.assertEqual(result["Full name: "], "The Octocat")
+        self.assertEqual(result["Nickname: "], "octocat")
+        self.assertEqual(len(result["Popular repos: "]), 6)
+        self.assertEqual(
+            result["URLs of popular repos: "][0], "https://github.com/octocat/repo-1"
+        )
+        self.assertEqual(result["Location: "], "San Francisco")
+
+    def test_compiled_and_raw_configs_give_same_result(self):
+        raw_config = dict(self.config)
+        compiled_result, raw_result = scraping([
+            (self.link, compile_site_config(self.config)),
+            (self.link, raw_config),
+        ])
+        self.assertEqual(compiled_result, raw_result)
+        self.assertEqual(raw_config, self.config)
+
+    def test_session_is_reused_across_runs(self):
+        engine = get_scraper_engine()
+        scraping([(self.link, self.config)])
+        first_session = engine.run(engine.get_session())
+        scraping([(self.link, self.config), (self.link, self.config)])
+        second_session = engine.run(engine.get_session())
+        self.assertIs(first_session, second_session)
+        self.assertFalse(second_session.closed)
+
+    def test_scrape_many_inside_callers_loop(self):
+        async def scrape_alongside_other_io():
+            other_io = asyncio.create_task(asyncio.sleep(0, result="other"))
+            results = await scrape_many([(self.link, self.config)])
+            await get_scraper_engine().close()
+            return results, await other_io
+
+        (result,), other_result = asyncio.run(scrape_alongside_other_io())
+        self.assertEqual(result["Nickname: "], "octocat")
+        self.assertEqual(other_result, "other")
+
+    def test_sync_shim_refuses_running_loop(self):
+        async def call_sync_shim():
+            scraping([(self.link, self.config)])
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(call_sync_shim())
+
+    def test_failed_and_hung_links_become_error_records(self):
+        engine = ScraperEngine(ScraperSettings(read_timeout=0.3, batch_deadline=5))
+        base_link = self.link.rsplit("/", 1)[0]
+        links_and_configs = [
+            (f"{base_link}/slow", self.config),
+            (self.link, self.config),
+            (f"{base_link}/missing.html", self.config),
+        ]
+        slow, found, missing = engine.run(scrape_many(links_and_configs, engine))
+        engine.run(engine.close())
+        self.assertTrue(is_error_record(slow))
+        self.assertIn("Timeout", slow["error"])
+        self.assertFalse(is_error_record(found))
+        self.assertEqual(found["Full name: "], "The Octocat")
+        self.assertTrue(is_error_record(missing))
+        self.assertEqual(missing["service_name"], "GitHub Profile")
+        self.assertEqual(missing["link"], f"{base_link}/missing.html")
+
+    def test_unexpected_errors_become_error_records(self):
+        find_elements = scraping_module._find_elements
+
+        def find_elements_failing_on_broken_link(link, html_tree, selectors):
+            if link.endswith("?broken"):
+                raise KeyError("unexpected")
+            return find_elements(link, html_tree, selectors)
+
+        with mock.patch.object(
+                scraping_module, "_find_elements", find_elements_failing_on_broken_link
+        ):
+            broken, found = scraping([
+                (f"{self.link}?broken", self.config),
+                (self.link, self.config),
+            ])
+        self.assertTrue(is_error_record(broken))
+        self.assertIn("KeyError", broken["error"])
+        self.assertEqual(found["Nickname: "], "octocat")
+
+    def test_batch_deadline(self):
+        engine = ScraperEngine(ScraperSettings(batch_deadline=0.3))
+        base_link = self.link.rsplit("/", 1)[0]
+
+        async def scrape_and_find_running_tasks():
+            results = await scrape_many([(f"{base_link}/slow", self.config)], engine)
+            return results, asyncio.all_tasks() - {asyncio.current_task()}
+
+        started = time.monotonic()
+        (slow,), running_tasks = engine.run(scrape_and_find_running_tasks())
+        engine.run(engine.close())
+        self.assertLess(time.monotonic() - started, 0.9)
+        self.assertTrue(is_error_record(slow))
+        # The cancelled download does not outlive the batch
+        self.assertEqual(running_tasks, set())
+
+    def test_streaming_and_buffered_parsing_give_same_result(self):
+        engine = ScraperEngine(ScraperSettings(streaming=False))
+        (buffered_result,) = engine.run(scrape_many([(self.link, self.config)], engine))
+        engine.run(engine.close())
+        (streamed_result,) = scraping([(self.link, self.config)])
+        self.assertEqual(buffered_result, streamed_result)
+
+    def test_streaming_decodes_pages_without_known_charset(self):
+        base_link = self.link.rsplit("/", 1)[0]
+        results = scraping([
+            (f"{base_link}/cyrillic", self.config),
+            (f"{base_link}/cyrillic?bogus-enc", self.config),
+            (f"{base_link}/cyrillic?utf-8", self.config),
+        ])
+        for result in results:
+            self.assertEqual(result["Full name: "], "Октокіт Łódź")
+
+    def test_streaming_content_type_and_body_size(self):
+        engine = ScraperEngine(ScraperSettings(max_body_size=10000))
+        base_link = self.link.rsplit("/", 1)[0]
+        json_page, large_page = engine.run(scrape_many([
+            (f"{base_link}/instagram_analyzing_resource.json", self.config),
+            (self.link, self.config),
+        ], engine))
+        engine.run(engine.close())
+        self.assertIn("Content-Type", json_page["error"])
+        self.assertIn("10000 bytes", large_page["error"])
+
+    def test_streaming_stops_when_fields_are_resolvable(self):
+        engine = ScraperEngine(ScraperSettings(chunk_size=1024, stop_when_resolved=True))
+        (result,) = engine.run(scrape_many([(self.link, self.config)], engine))
+        engine.run(engine.close())
+        self.assertFalse(is_error_record(result))
+        self.assertEqual(result["Nickname: "], "octocat")
+        self.assertEqual(result["Location: "], "San Francisco")
+
+    def test_streaming_stops_only_after_fields_are_parsed(self):
+        selectors = compile_site_config({
+            "service_name": "Profile",
+            "Loc: ": "//span[@class='l']",
+            "Name: ": "//h1/text()",
+        })
+        chunks = [
+            b"<html><body><h1>The Octocat</h1><div><span class='l'>",
+            b"San Fran",
+            b"cisco</span>",
+            b"</div><p>Repositories</p>",
+        ]
+        parser = _IncrementalHtmlParser("utf-8")
+        stopped = [parser.feed(chunk, selectors) for chunk in chunks]
+        self.assertEqual(stopped, [False, False, False, True])
+        result = scraping_module._find_elements("link", parser.close(), selectors)
+        self.assertEqual(result["Loc: "], "San Francisco")
+        self.assertEqual(result["Name: "], "The Octocat")
+
+    def test_parsing_on_loop_and_in_threads_give_same_result(self):
+        results = []
+        for parse_workers in (0, 2):
+            engine = ScraperEngine(ScraperSettings(parse_workers=parse_workers))
+            results.append(engine.run(scrape_many([(self.link, self.config)] * 3, engine)))
+            engine.run(engine.close())
+            self.assertGreaterEqual(engine.loop_blocked_time, 0)
+        on_loop, in_threads = results
+        self.assertEqual(on_loop, in_threads)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+import os
+import pickle
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from tweepy.errors import TweepyException
+
+from app.backend.analyzing.twitter.twitter import caller_analyze_twitter
+from app.backend.scraping.helpers.persistent_cache import CACHE_DIRECTORY_ENV
+from app.backend.scraping.twitter._twitter_search import TwitterSearch
+from app.backend.scraping.twitter.twitter import caller_twitter
+
+
+class _TwitterApiStub:
+    users = [
+        {"id": 1, "id_str": "1", "name": "The Octocat", "screen_name": "octocat"},
+        {"id": 2, "id_str": "2", "name": "Mona Lisa", "screen_name": "monalisa"},
+    ]
+
+    def __init__(self, users=None, posts=None, protected=()):
+        if users is not None:
+            self.users = users
+        self.posts = posts or {}
+        self.protected = protected
+        self.timelines = []
+
+    def search_users(self, query):
+        return [SimpleNamespace(**user, verified=False) for user in self.users]
+
+    def user_timeline(self, screen_name, **kwargs):
+        self.timelines.append(screen_name)
+        self.timeline_kwargs = kwargs
+        if screen_name in self.protected:
+            raise TweepyException("Not authorized.")
+        if screen_name in self.posts:
+            return [SimpleNamespace(text=text) for text in self.posts[screen_name]]
+        return [
+            SimpleNamespace(text=f"Hello from {screen_name} https://t.co/x"),
+            SimpleNamespace(text="Second post"),
+        ]
+
+
+class TestScrapingTwitter(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        environment = mock.patch.dict(os.environ, {CACHE_DIRECTORY_ENV: directory.name})
+        environment.start()
+        self.addCleanup(environment.stop)
+
+    @staticmethod
+    def __twitter_search(bypass_cache=False, posts=None, **kwargs):
+        twitter_obj = TwitterSearch("octocat", bypass_cache=bypass_cache, **kwargs)
+        twitter_obj._api = _TwitterApiStub(posts=posts)
+        twitter_obj.twitter_search()
+        return twitter_obj
+
+    def test_subjects_info_and_posts(self):
+        twitter_obj = self.__twitter_search()
+        self.assertEqual(twitter_obj.filtered_subjects_info, [
+            {"name": "The Octocat", "screen_name": "octocat"},
+            {"name": "Mona Lisa", "screen_name": "monalisa"},
+        ])
+        self.assertEqual(twitter_obj.subjects_posts_text, [
+            ["Hello from octocat ", "Second post"], ["Hello from monalisa ", "Second post"]
+        ])
+
+    def test_posts_are_cached_by_user_id(self):
+        self.assertCountEqual(self.__twitter_search()._api.timelines, ["octocat", "monalisa"])
+        twitter_obj = self.__twitter_search()
+        self.assertEqual(twitter_obj._api.timelines, [])
+        self.assertEqual(twitter_obj.subjects_posts_text[1], ["Hello from monalisa ", "Second post"])
+        twitter_obj = self.__twitter_search(bypass_cache=True)
+        self.assertCountEqual(twitter_obj._api.timelines, ["octocat", "monalisa"])
+
+    def test_only_posts_the_report_uses_are_requested(self):
+        twitter_obj = self.__twitter_search()
+        self.assertEqual(
+            twitter_obj._api.timeline_kwargs,
+            {"count": 20, "exclude_replies": True, "include_rts": False},
+        )
+        posts = {"octocat": ["First", "Second", "Third"], "monalisa": ["Only"]}
+        twitter_obj = self.__twitter_search(bypass_cache=True, posts=posts)
+        self.assertEqual(twitter_obj.subjects_posts_text, [["First", "Second"], ["Only"]])
+        twitter_obj = self.__twitter_search(posts=posts, posts_count=3)
+        self.assertCountEqual(twitter_obj._api.timelines, ["octocat", "monalisa"])
+        self.assertEqual(
+            twitter_obj.subjects_posts_text, [["First", "Second", "Third"], ["Only"]]
+        )
+        twitter_obj = self.__twitter_search(bypass_cache=True, posts_count=50)
+        self.assertEqual(twitter_obj._api.timeline_kwargs["count"], 50)
+
+    def test_name_filter_pushdown_gives_the_same_analysis(self):
+        with open("test/resources/twitter_analyzing_resource.pickle", "rb") as file:
+            ((amy_butler_info, amy_butler_posts),) = pickle.load(file)["twitter"]
+        users = [
+            # The posts of a protected subject are not available
+            dict(amy_butler_info, name="Protected Person", screen_name="protected"),
+            dict(amy_butler_info, name="Amy Butler-Smith", screen_name="amy_b"),
+            dict(amy_butler_info, id_str="1"),
+            dict(amy_butler_info, name="Amy Butler", screen_name="amybutler_official"),
+            dict(amy_butler_info, name="Эми Батлер", screen_name="amy_ua"),
+        ]
+        for i, user in enumerate(users):
+            user["id_str"] = str(i)
+        posts = {
+            user["screen_name"]: [amy_butler_posts[0], f"Hello from {user['screen_name']}"]
+            for user in users
+        }
+        user_input = {
+            "first_name": "Amy",
+            "last_name": "Butler",
+            "twitter_profile": "",
+            "location": "Ukraine",
+            "additional_text": "CELTA English teacher",
+        }
+        analyses = []
+        for pushdown_user_input in (None, user_input):
+            api = _TwitterApiStub(users, posts, protected=["protected"])
+            with mock.patch.object(
+                TwitterSearch, "twitter_authorize", lambda self, api=api: setattr(self, "_api", api)
+            ):
+                scraping_response = caller_twitter(
+                    "Amy Butler", bypass_cache=True, pushdown_user_input=pushdown_user_input
+                )
+            analyses.append(caller_analyze_twitter(scraping_response, user_input))
+        self.assertCountEqual(api.timelines, ["WayfarersBook", "amybutler_official"])
+        self.assertEqual(analyses[0], analyses[1])
+        potential_subjects = analyses[1]["twitter"]["potential_subjects"]
+        self.assertEqual(len(potential_subjects), 2)
+        for subject_info, subject_posts in potential_subjects:
+            self.assertEqual(subject_posts, posts[subject_info["screen_name"]])
+
+        user_input["twitter_profile"] = "amy_ua"
+        api = _TwitterApiStub(users, posts)
+        with mock.patch.object(
+            TwitterSearch, "twitter_authorize", lambda self: setattr(self, "_api", api)
+        ):
+            scraping_response = caller_twitter(
+                "amy_ua", bypass_cache=True, pushdown_user_input=user_input
+            )
+        self.assertEqual(api.timelines, ["amy_ua"])
+        self.assertEqual(
+            caller_analyze_twitter(scraping_response, user_input)["twitter"]["found_subjects"],
+            [(dict(amy_butler_info, name="Эми Батлер", screen_name="amy_ua"), posts["amy_ua"])],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()